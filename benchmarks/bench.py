@@ -0,0 +1,311 @@
+"""
+Benchmarks for the game's hot paths.
+
+Times the simulation calls the frame loop depends on plus one full
+GameManager frame, and reports for each:
+
+- ns_per_op: best mean over several repeats
+- peak_bytes_per_op: transient memory an op allocates (tracemalloc peak)
+- blocks_per_op: net allocated blocks an op leaves behind
+- instructions (frame only): graphics instructions in the game layers and
+  instructions allocated per frame
+
+The frame benchmark needs Kivy; without a display it uses SDL's offscreen
+video driver. Run with ``python -m benchmarks.bench [-o results.json]
+[--compare previous.json]``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from simulation.character import Chicken
+from simulation.obstacles import Spike
+from simulation.obstacles_manager import SpikeGenerator
+from simulation.pattern_pool import gap_probability
+from simulation.reachability import reachability_for
+
+WIDTH, HEIGHT = 1000, 700
+DIFFICULTY_LEVELS = range(1, 8)  # gap probability bottoms out at level 6
+
+
+def measure(op, number=20000, repeat=5):
+    """Time ``op()`` and sample its allocations"""
+    for _ in range(min(number, 1000)):
+        op()
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            op()
+        elapsed = (time.perf_counter_ns() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+
+    samples = min(number, 2000)
+    blocks = sys.getallocatedblocks()
+    for _ in range(samples):
+        op()
+    blocks = (sys.getallocatedblocks() - blocks) / samples
+
+    peak = 0
+    tracemalloc.start()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        op()
+        peak += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "ns_per_op": round(best, 1),
+        "peak_bytes_per_op": round(peak / samples, 1),
+        "blocks_per_op": round(blocks, 3),
+    }
+
+
+def bench_chicken_update():
+    chicken = Chicken(WIDTH / 2, HEIGHT / 2)
+    bounds = (WIDTH, HEIGHT)
+
+    def op():
+        # Keep the chicken bouncing and airborne indefinitely
+        if chicken.pos.y < HEIGHT / 3:
+            chicken.jump()
+        chicken.alive = True
+        chicken.update(1.0 / 120.0, bounds)
+
+    return measure(op)
+
+
+def bench_check_collisions():
+    rng = random.Random(1)
+    generator = SpikeGenerator(WIDTH, HEIGHT, seed=1)
+    chickens = [
+        Chicken(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(256)
+    ]
+    index = [0]
+
+    def op():
+        index[0] = (index[0] + 1) & 255
+        generator.check_collisions(chickens[index[0]])
+
+    return measure(op)
+
+
+def bench_sweep_collisions():
+    rng = random.Random(1)
+    generator = SpikeGenerator(WIDTH, HEIGHT, seed=1)
+    chickens = [
+        Chicken(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(256)
+    ]
+    index = [0]
+
+    def op():
+        index[0] = (index[0] + 1) & 255
+        chicken = chickens[index[0]]
+        generator.sweep_collisions(chicken, chicken.pos.x - 1.5, chicken.pos.y + 3)
+
+    return measure(op)
+
+
+def bench_regenerate(level):
+    generator = SpikeGenerator(WIDTH, HEIGHT, seed=level)
+    coords = [(WIDTH - 15, 0), (15, 0)]
+    flip = [0]
+
+    def op():
+        flip[0] ^= 1
+        generator.regenerate_spikes(coords[flip[0]], level)
+
+    return measure(op, number=5000)
+
+
+def bench_triangle_points():
+    spikes = [Spike(0, 35 * i, 40, 33, pointing_right=i % 2 == 0) for i in range(20)]
+    index = [0]
+
+    def op():
+        index[0] = (index[0] + 1) % 20
+        spikes[index[0]].get_triangle_points()
+
+    return measure(op)
+
+
+def bench_is_passable():
+    rng = random.Random(1)
+    reachability = reachability_for(HEIGHT, int(HEIGHT // 35))
+    gap = gap_probability(6)
+    columns = [
+        bytearray(rng.random() > gap for _ in range(reachability.num_rows))
+        for _ in range(256)
+    ]
+    index = [0]
+
+    def op():
+        index[0] = (index[0] + 1) & 255
+        reachability.is_passable(columns[index[0]])
+
+    return measure(op)
+
+
+def count_instructions(group):
+    """Number of instructions in a canvas subtree"""
+    total = 0
+    for child in group.children:
+        total += 1
+        if hasattr(child, "children"):
+            total += count_instructions(child)
+    return total
+
+
+def walk_instructions(group):
+    """Every instruction in a canvas subtree"""
+    for child in group.children:
+        yield child
+        if hasattr(child, "children"):
+            yield from walk_instructions(child)
+
+
+def instructions_allocated(op, canvas, frames=500):
+    """Instructions per ``op`` found in ``canvas`` that were not there before.
+
+    The previous frame's instructions are held, so a new instruction cannot
+    reuse the id of one that was freed.
+    """
+    allocated = 0
+    for _ in range(frames):
+        before = list(walk_instructions(canvas))
+        seen = {id(instruction) for instruction in before}
+        op()
+        allocated += sum(
+            id(instruction) not in seen for instruction in walk_instructions(canvas)
+        )
+    return allocated / frames
+
+
+def recorded_runs(count):
+    """Replays of ``count`` headless runs by a simple bot"""
+    from simulation.core import GameCore
+    from simulation.replay import Replay
+
+    replays = []
+    for seed in range(count):
+        core = GameCore(WIDTH, HEIGHT, seed=seed)
+        core.run(
+            lambda c: c.chicken.pos.y < HEIGHT / 3 and c.chicken.gravity_velocity.y < 0,
+            6000,
+        )
+        replays.append(Replay.from_core(core))
+    return replays
+
+
+def bench_frame(ghosts=0):
+    """One GameManager.update + draw_game frame under a headless window"""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    from kivy.core.window import Window
+    from widgets.game_manager import GameManager
+
+    game = GameManager(size=(WIDTH, HEIGHT))
+    Window.add_widget(game)
+    game.initialize_game(0)
+    if ghosts:
+        game.start_race(recorded_runs(ghosts))
+
+    def op():
+        core = game.core
+        if core.game_over:
+            game.reset_game()
+        elif core.chicken.pos.y < HEIGHT / 3 and core.chicken.gravity_velocity.y < 0:
+            core.jump()
+        game.update(1.0 / 60.0)
+
+    result = measure(op, number=2000)
+    result["instructions"] = count_instructions(game.canvas.before)
+    result["instructions_allocated_per_frame"] = round(
+        instructions_allocated(op, game.canvas.before), 3
+    )
+    Window.remove_widget(game)
+    return result
+
+
+def run(include_frame=True):
+    results = {
+        "Chicken.update": bench_chicken_update(),
+        "SpikeGenerator.check_collisions": bench_check_collisions(),
+        "SpikeGenerator.sweep_collisions": bench_sweep_collisions(),
+        "Spike.get_triangle_points": bench_triangle_points(),
+        "Reachability.is_passable": bench_is_passable(),
+    }
+    for level in DIFFICULTY_LEVELS:
+        results[f"SpikeGenerator.regenerate_spikes[level={level}]"] = (
+            bench_regenerate(level)
+        )
+    if include_frame:
+        results["GameManager.frame"] = bench_frame()
+        results["GameManager.frame[ghosts=500]"] = bench_frame(ghosts=500)
+    return results
+
+
+def compare(results, previous):
+    """Print ns/op changes against an earlier results file"""
+    for name, result in results.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        ratio = result["ns_per_op"] / before["ns_per_op"]
+        print(f"  {name:<50} {ratio:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from an earlier run")
+    parser.add_argument(
+        "--no-frame", action="store_true", help="skip the Kivy frame benchmark"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(include_frame=not args.no_frame)
+    for name, result in results.items():
+        extra = ""
+        if "instructions" in result:
+            extra = (
+                f"  {result['instructions']} instructions,"
+                f" {result['instructions_allocated_per_frame']} allocated/frame"
+            )
+        print(
+            f"{name:<52} {result['ns_per_op']:>10.1f} ns/op"
+            f" {result['peak_bytes_per_op']:>9.1f} B/op"
+            f" {result['blocks_per_op']:>7.3f} blocks/op{extra}"
+        )
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["results"]
+        print(f"ns/op relative to {args.compare}:")
+        compare(results, previous)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Startup benchmark.
+
+Starts the game in fresh processes and reports, as medians over the runs:
+
+- import_ms: importing ``main`` (Kivy, the window and the game modules)
+- first_frame_ms: from the first line of the script to the first frame
+  that shows a running game
+- process_ms: wall time from spawning the interpreter to that frame
+
+Without a display it uses SDL's offscreen video driver. Run with
+``python -m benchmarks.startup [-n 5] [-o startup.json]
+[--compare previous.json]``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child process; prints one JSON line once the first frame is up
+CHILD = """
+import time
+start = time.perf_counter()
+import json, sys
+sys.path.insert(0, {root!r})
+import main
+imported = time.perf_counter()
+
+from kivy.core.window import Window
+
+app = main.GameApp()
+
+def first_flip(*_):
+    game = app.root
+    if game is None or game.core is None or not game.render_stats["frames"]:
+        return
+    Window.unbind(on_flip=first_flip)
+    print(json.dumps({{
+        "import_ms": (imported - start) * 1e3,
+        "first_frame_ms": (time.perf_counter() - start) * 1e3,
+    }}), flush=True)
+    app.stop()
+
+Window.bind(on_flip=first_flip)
+app.run()
+"""
+
+
+def sample():
+    """Start the game once and time it"""
+    env = dict(os.environ)
+    env.setdefault("KIVY_NO_ARGS", "1")
+    if sys.platform.startswith("linux") and not env.get("DISPLAY"):
+        env.setdefault("SDL_VIDEODRIVER", "offscreen")
+    with tempfile.TemporaryDirectory() as home:
+        # Fresh user data (scores, replays) for every run
+        env["XDG_CONFIG_HOME"] = home
+        spawned = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", CHILD.format(root=ROOT)],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        elapsed = (time.perf_counter() - spawned) * 1e3
+    for line in proc.stdout.splitlines():
+        if line.startswith("{"):
+            result = json.loads(line)
+            break
+    else:
+        raise RuntimeError(f"game did not reach its first frame:\n{proc.stderr[-2000:]}")
+    # The child reports its first frame just before shutting down
+    result["process_ms"] = elapsed
+    return result
+
+
+def run(runs=5):
+    samples = [sample() for _ in range(runs)]
+    return {
+        key: round(statistics.median(s[key] for s in samples), 1)
+        for key in ("import_ms", "first_frame_ms", "process_ms")
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--runs", type=int, default=5, help="processes to start")
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from an earlier run")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs)
+    for name, value in results.items():
+        print(f"{name:<16} {value:>9.1f} ms")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["results"]
+        print(f"relative to {args.compare}:")
+        for name, value in results.items():
+            if previous.get(name):
+                print(f"  {name:<14} {value / previous[name]:6.2f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,51 @@ Chicken Jump Game
 A simple wall-jumping game where a chicken bounces between walls avoiding spikes.
 """
 
+import os
+
+from kivy.config import Config
+
+# Open the window at its final size instead of resizing it after creation
+Config.set("graphics", "width", "1000")
+Config.set("graphics", "height", "700")
+
 from kivy.app import App
+from kivy.logger import Logger
 from kivy.core.window import Window
 
-from widgets.game_manager import GameManager
-
 class GameApp(App):
     """Main application class"""
 
     def build(self):
+        # The game modules load while the window is already up
+        from widgets.game_manager import GameManager
+
         # Set window properties
         Window.clearcolor = (0.05, 0.05, 0.15, 1)
         Window.size = (1000, 700)
 
         # Create and return game widget
-        game = GameManager()
+        game = GameManager(
+            replay_dir=os.path.join(self.user_data_dir, "replays"),
+            trace_dir=os.path.join(self.user_data_dir, "traces"),
+            score_dir=os.path.join(self.user_data_dir, "scores"),
+            measure_wakeups=bool(os.environ.get("CHICKEN_MEASURE_WAKEUPS")),
+            gc_budget=bool(os.environ.get("CHICKEN_GC_BUDGET")),
+            count_blocks=bool(os.environ.get("CHICKEN_COUNT_BLOCKS")),
+        )
         return game
 
+    def on_stop(self):
+        self.root.shutdown()
+
+        # Report loop wakeups when CHICKEN_MEASURE_WAKEUPS is set
+        for state, rate in self.root.wakeup_report().items():
+            Logger.info(f"Loop: {state}: {rate:.1f} wakeups/s")
+
+        # Report per-frame allocations when CHICKEN_COUNT_BLOCKS is set
+        for name, value in self.root.allocation_report().items():
+            Logger.info(f"GC: {name}: {value:g}")
+
 
 if __name__ == "__main__":
     GameApp().run()
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Vectorized batch simulator.
+
+Runs N independent games in lockstep with every chicken and spike column
+stored in NumPy arrays. Meant for balance sweeps over ``gravity``,
+``jump_force``, the horizontal speed and the gap probability curve; one
+batch slot is one episode.
+"""
+
+import numpy as np
+
+from .core import PHYSICS_DT
+from .pattern_pool import gap_probability
+from .reachability import Reachability
+
+# Death causes reported per episode
+ALIVE = 0
+FLOOR = 1
+CEILING = 2
+SPIKE = 3
+TIMEOUT = 4
+CAUSE_NAMES = ("alive", "floor", "ceiling", "spike", "timeout")
+
+
+# The pool's curve, over arrays of difficulty levels
+default_gap_probability = np.vectorize(gap_probability, otypes=[float])
+
+
+class BatchSimulator:
+    """N chickens and their spike walls advanced together"""
+
+    def __init__(
+        self,
+        n,
+        width,
+        height,
+        dt=PHYSICS_DT,
+        gravity=-981.0,
+        jump_force=400.0,
+        speed=180.0,
+        size=30,
+        spike_height=35,
+        wall_thickness=40,
+        gap_curve=default_gap_probability,
+        fair_walls=True,
+        seed=None,
+    ):
+        self.n = n
+        self.width = float(width)
+        self.height = float(height)
+        self.dt = dt
+        self.gravity = gravity
+        self.jump_force = jump_force
+        self.speed = speed
+        self.size = size
+        self.radius = size // 2
+        self.spike_height = spike_height
+        self.wall_thickness = wall_thickness
+        self.gap_curve = gap_curve
+        self.rows = int(height // spike_height)
+        # Bottom edge of every spike row; spikes are 2px shorter than a row
+        self.row_y = np.arange(self.rows) * spike_height
+        # Same passability fix as the pool, under this batch's physics
+        self.reachability = (
+            Reachability(
+                height,
+                self.rows,
+                row_height=spike_height,
+                spike_height=spike_height - 2,
+                wall_thickness=wall_thickness,
+                radius=self.radius,
+                size=size,
+                gravity=gravity,
+                jump_force=jump_force,
+                speed=speed,
+            )
+            if fair_walls
+            else None
+        )
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        """Put every chicken back at the center with fresh walls"""
+        n = self.n
+        self.x = np.full(n, self.width / 2)
+        self.y = np.full(n, self.height / 2)
+        self.vx = np.full(n, float(self.speed))
+        self.vy = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.cause = np.zeros(n, dtype=np.int8)
+        self.ticks = np.zeros(n, dtype=np.int32)
+        # spikes[i, 0] is the left wall, spikes[i, 1] the right wall
+        self.spikes = self.rng.random((n, 2, self.rows)) > self.gap_curve(0)
+        if self.reachability:
+            walls = self.spikes.reshape(2 * n, self.rows)
+            self.reachability.carve_many(walls, self.rng)
+
+    def step(self, jump=None):
+        """Advance every live chicken by one tick; ``jump`` is a bool mask"""
+        alive = self.alive
+        idx = np.flatnonzero(alive)
+        if idx.size == 0:
+            return
+
+        dt = self.dt
+        r = self.radius
+        if jump is not None:
+            jumping = idx[jump[idx]]
+            self.vy[jumping] = self.jump_force
+
+        vy = self.vy[idx] + self.gravity * dt
+        x = self.x[idx] + self.vx[idx] * dt
+        y = self.y[idx] + vy * dt
+        vx = self.vx[idx]
+
+        # Wall bounces
+        left = x <= r
+        right = ~left & (x >= self.width - r)
+        x[left] = r
+        x[right] = self.width - r
+        vx = np.where(left, np.abs(vx), np.where(right, -np.abs(vx), vx))
+
+        self.x[idx] = x
+        self.y[idx] = y
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.ticks[idx] += 1
+
+        # Floor and ceiling deaths
+        floor = y <= r
+        ceiling = ~floor & (y >= self.height - r)
+        self.cause[idx[floor]] = FLOOR
+        self.cause[idx[ceiling]] = CEILING
+
+        # Score and regenerate the wall opposite the one that was hit
+        hit = left | right
+        if hit.any():
+            hit_idx = idx[hit]
+            self.score[hit_idx] += 1
+            level = 1 + self.score[hit_idx] // 5
+            gap = self.gap_curve(level)
+            column = np.where(right[hit], 0, 1)
+            fresh = self.rng.random((hit_idx.size, self.rows)) > gap[:, None]
+            if self.reachability:
+                self.reachability.carve_many(fresh, self.rng)
+            self.spikes[hit_idx, column] = fresh
+
+        # AABB test against both spike walls, only for chickens within reach
+        cx = x - r
+        near_left = cx < self.wall_thickness
+        near_right = cx + self.size > self.width - self.wall_thickness
+        near = (near_left | near_right) & ~(floor | ceiling)
+        if near.any():
+            cy = (y - r)[near][:, None]
+            rows_hit = (cy < self.row_y + self.spike_height - 2) & (
+                cy + self.size > self.row_y
+            )
+            near_idx = idx[near]
+            spikes = self.spikes[near_idx]
+            touched = (
+                (rows_hit & spikes[:, 0]).any(axis=1) & near_left[near]
+            ) | ((rows_hit & spikes[:, 1]).any(axis=1) & near_right[near])
+            self.cause[near_idx[touched]] = SPIKE
+
+        self.alive[idx] = self.cause[idx] == ALIVE
+
+    def run(self, policy, max_ticks):
+        """Step until every chicken is dead or ``max_ticks`` have elapsed.
+
+        ``policy(sim)`` returns a bool jump mask of length N. Returns the
+        per-episode scores and death causes.
+        """
+        for _ in range(max_ticks):
+            if not self.alive.any():
+                break
+            self.step(policy(self))
+        self.cause[self.alive] = TIMEOUT
+        self.alive[:] = False
+        return self.score, self.cause
+
+    def cause_counts(self):
+        """Number of episodes per death cause name"""
+        counts = np.bincount(self.cause, minlength=len(CAUSE_NAMES))
+        return dict(zip(CAUSE_NAMES, counts.tolist()))
@@ -1,12 +1,12 @@
-from kivy.vector import Vector
+from .vector import Vec2
 
 class Chicken:
     """Player character - a chicken that bounces between walls"""
 
     def __init__(self, x, y, size=30):
-        self.pos = Vector(x, y)
-        self.velocity = Vector(180, 0)  # Start moving right
-        self.gravity_velocity = Vector(0, 0)  # Separate gravity velocity
+        self.pos = Vec2(x, y)
+        self.velocity = Vec2(180, 0)  # Start moving right
+        self.gravity_velocity = Vec2(0, 0)  # Separate gravity velocity
         self.size = size
         self.radius = size // 2
         self.gravity = -981  # Gravity acceleration
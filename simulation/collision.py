@@ -0,0 +1,35 @@
+"""
+Swept AABB collision.
+
+A moving box against a static box reduces to the box's reference point
+moving along a segment against the static box grown by the mover's extents
+(the Minkowski sum). The slab test then gives the fraction of the segment
+at which the point first enters, which is the time of impact within a step.
+"""
+
+
+def sweep_point(x0, y0, x1, y1, left, bottom, right, top):
+    """Fraction in [0, 1] at which the segment first enters the open box.
+
+    Returns None if the segment never gets strictly inside. Touching an edge
+    is not a hit, matching the strict overlap test of ``Spike.check_collision``.
+    """
+    t_enter = 0.0
+    t_exit = 1.0
+    for start, end, lo, hi in ((x0, x1, left, right), (y0, y1, bottom, top)):
+        delta = end - start
+        if delta == 0:
+            if not lo < start < hi:
+                return None
+            continue
+        t_lo = (lo - start) / delta
+        t_hi = (hi - start) / delta
+        if t_lo > t_hi:
+            t_lo, t_hi = t_hi, t_lo
+        if t_lo > t_enter:
+            t_enter = t_lo
+        if t_hi < t_exit:
+            t_exit = t_hi
+        if t_enter >= t_exit:
+            return None
+    return t_enter
@@ -0,0 +1,195 @@
+"""
+Headless game core.
+
+Holds the chicken, the spike walls and the score and advances them with a
+plain ``step(action)`` call, so the rules can run without Kivy and as fast as
+the CPU allows (bots, regression checks, balance sweeps).
+
+Physics always runs at a fixed rate. ``advance`` turns real elapsed time into
+whole ticks through an accumulator, and ``render_position`` interpolates the
+chicken between the last two ticks, so the display rate does not change
+gameplay.
+
+Spike collisions are swept along each tick's move, and ``contact`` holds the
+time and point of the last wall hit or spike contact, so a big step cannot
+skip over a spike.
+
+Every run is driven by its own seeded RNG and the ticks on which jumps were
+applied are kept in ``jump_ticks``, which is all a replay needs.
+"""
+
+import random
+from array import array
+
+from .character import Chicken
+from .obstacles_manager import SpikeGenerator
+from .pattern_pool import SpikeColumnPool
+from .score_manager import ScoreManager
+
+PHYSICS_DT = 1.0 / 120.0  # Fixed physics tick
+MAX_CATCH_UP_STEPS = 8  # Ticks run per advance() before dropping the backlog
+
+
+class GameCore:
+    """Game rules without any rendering or clock dependency"""
+
+    def __init__(
+        self,
+        width,
+        height,
+        dt=PHYSICS_DT,
+        score_manager=None,
+        max_catch_up=MAX_CATCH_UP_STEPS,
+        seed=None,
+        pool=None,
+    ):
+        self.width = width
+        self.height = height
+        self.dt = dt
+        self.max_catch_up = max_catch_up
+        self.score_manager = score_manager or ScoreManager()
+        # Spike columns; pass a pool with a worker to build them off the frame
+        self.pool = pool or SpikeColumnPool(width, height, depth=0)
+        self.chicken = None
+        self.spike_generator = None
+        self.game_over = False
+        self.ticks = 0
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new run, keeping the high score.
+
+        A fresh seed is drawn when none is given.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.chicken = Chicken(self.width / 2, self.height / 2)
+        self.spike_generator = SpikeGenerator(
+            self.width, self.height, seed=seed, pool=self.pool
+        )
+        self.score_manager.reset_current_score()
+        self.game_over = False
+        self.ticks = 0
+        self.time = 0.0
+        self.contact = None  # (kind, time, x, y) of the last wall or spike contact
+        self.jump_queued = False
+        self.jump_ticks = array("I")  # Ticks on which a jump was applied
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Fraction of a tick since the last step
+        self.prev_x = self.chicken.pos.x
+        self.prev_y = self.chicken.pos.y
+        self.resized = False  # A resized run no longer matches its replay
+
+    def resize(self, width, height):
+        """Carry the run over to a new board size.
+
+        The chicken keeps its relative place between the walls and floor and
+        ceiling, and the spike walls are stretched onto the new row grid.
+        """
+        if (width, height) == (self.width, self.height):
+            return
+        r = self.chicken.radius
+
+        def remap(value, old, new):
+            if old <= 2 * r:
+                return new / 2
+            return r + (value - r) * (new - 2 * r) / (old - 2 * r)
+
+        pos = self.chicken.pos
+        pos.x = remap(pos.x, self.width, width)
+        pos.y = remap(pos.y, self.height, height)
+        self.prev_x = remap(self.prev_x, self.width, width)
+        self.prev_y = remap(self.prev_y, self.height, height)
+        self.width = width
+        self.height = height
+        self.spike_generator.resize(width, height)
+        self.resized = True
+
+    def jump(self):
+        """Queue a jump for the next tick"""
+        self.jump_queued = True
+
+    def step(self, action=False, dt=None):
+        """Advance one tick; ``action`` makes the chicken jump first.
+
+        Returns True when the chicken hit a wall during this tick.
+        """
+        if self.game_over:
+            return False
+
+        chicken = self.chicken
+        self.prev_x = chicken.pos.x
+        self.prev_y = chicken.pos.y
+        if action or self.jump_queued:
+            self.jump_queued = False
+            chicken.jump()
+            self.jump_ticks.append(self.ticks)
+
+        dt = self.dt if dt is None else dt
+        wall_hit, coords = chicken.update(dt, (self.width, self.height))
+        self.ticks += 1
+        self.time += dt
+
+        # Every wall hit scores and regenerates the opposite wall
+        if wall_hit:
+            travel = abs(chicken.velocity.x) * dt
+            fraction = abs(chicken.pos.x - self.prev_x) / travel
+            self.contact = (
+                "wall",
+                self.time - dt * (1 - fraction),
+                chicken.pos.x,
+                self.prev_y + (chicken.pos.y - self.prev_y) * fraction,
+            )
+            self.score_manager.add_point()
+            self.spike_generator.regenerate_spikes(
+                coords, self.score_manager.difficulty_level
+            )
+
+        hit = self.spike_generator.sweep_collisions(
+            chicken, self.prev_x, self.prev_y
+        )
+        if hit:
+            fraction, x, y = hit
+            self.contact = ("spike", self.time - dt * (1 - fraction), x, y)
+            chicken.alive = False
+
+        if not chicken.alive:
+            self.game_over = True
+
+        return wall_hit
+
+    def advance(self, elapsed):
+        """Run the fixed ticks covered by ``elapsed`` real seconds.
+
+        At most ``max_catch_up`` ticks run per call; any further backlog is
+        dropped so a long hitch slows the game down instead of snowballing.
+        Returns the number of wall hits.
+        """
+        self.accumulator += elapsed
+        hits = 0
+        steps = 0
+        while self.accumulator >= self.dt and not self.game_over:
+            if steps == self.max_catch_up:
+                self.accumulator = 0.0
+                break
+            hits += self.step()
+            self.accumulator -= self.dt
+            steps += 1
+        self.alpha = self.accumulator / self.dt
+        return hits
+
+    def render_position(self):
+        """Chicken position interpolated between the last two ticks"""
+        pos = self.chicken.pos
+        alpha = self.alpha
+        return (
+            self.prev_x + (pos.x - self.prev_x) * alpha,
+            self.prev_y + (pos.y - self.prev_y) * alpha,
+        )
+
+    def run(self, policy, max_ticks):
+        """Play until game over or ``max_ticks``; ``policy(core)`` returns the action"""
+        while not self.game_over and self.ticks < max_ticks:
+            self.step(policy(self))
+        return self.score_manager.current_score
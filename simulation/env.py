@@ -0,0 +1,84 @@
+"""
+Reset/step environment for training agents.
+
+``ChickenEnv`` wraps GameCore with the Gymnasium calling convention without
+depending on it: ``reset`` returns ``(observation, info)`` and ``step``
+returns ``(observation, reward, terminated, truncated, info)``. The action is
+1 to jump and 0 to do nothing, and every wall hit is worth a reward of 1.
+
+The observation is a float32 vector of ``4 + 2 * rows`` values: chicken x
+and y as fractions of the board, horizontal and vertical velocity divided
+by the jump force, then the occupancy (0 or 1) of every spike row of the
+left wall followed by the right wall.
+"""
+
+import random
+
+import numpy as np
+
+from .core import GameCore
+
+
+class ChickenEnv:
+    """One game behind a reset/step interface"""
+
+    def __init__(
+        self, width=1000, height=700, seed=None, max_ticks=None, frame_skip=1
+    ):
+        self.core = GameCore(width, height, seed=0)
+        self.rows = self.core.pool.num_rows
+        self.observation_size = 4 + 2 * self.rows
+        self.max_ticks = max_ticks  # Episodes are truncated after this many ticks
+        self.frame_skip = frame_skip  # Ticks per step; the action is on the first
+        # Episode seeds come from the env's own stream so forked copies differ
+        self.rng = random.Random(seed)
+
+    def reset(self, seed=None):
+        """Start an episode; returns (observation, info)"""
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+        self.core.reset(seed)
+        return self.observe(), {"seed": seed}
+
+    def step(self, action):
+        """Apply an action.
+
+        Returns (observation, reward, terminated, truncated, info).
+        """
+        out = np.empty(self.observation_size, dtype=np.float32)
+        reward, terminated, truncated = self.step_into(action, out)
+        info = {"score": self.core.score_manager.current_score}
+        return out, reward, terminated, truncated, info
+
+    def step_into(self, action, out):
+        """``step`` writing into ``out``; returns (reward, terminated, truncated)"""
+        core = self.core
+        reward = core.step(bool(action))
+        for _ in range(self.frame_skip - 1):
+            if core.game_over:
+                break
+            reward += core.step()
+        truncated = (
+            not core.game_over
+            and self.max_ticks is not None
+            and core.ticks >= self.max_ticks
+        )
+        self.observe(out)
+        return float(reward), core.game_over, truncated
+
+    def observe(self, out=None):
+        """Current observation, written into ``out`` when given"""
+        if out is None:
+            out = np.empty(self.observation_size, dtype=np.float32)
+        core = self.core
+        chicken = core.chicken
+        scale = chicken.jump_force
+        out[0] = chicken.pos.x / core.width
+        out[1] = chicken.pos.y / core.height
+        out[2] = chicken.velocity.x / scale
+        out[3] = chicken.gravity_velocity.y / scale
+        left, right = core.spike_generator.spikes
+        rows = self.rows
+        out[4 : 4 + rows] = np.frombuffer(left.occupied, dtype=np.uint8)
+        out[4 + rows :] = np.frombuffer(right.occupied, dtype=np.uint8)
+        return out
@@ -0,0 +1,101 @@
+"""
+Ghost chickens replaying past runs.
+
+A ``GhostPack`` moves every ghost together with the Chicken physics over
+NumPy arrays: gravity, horizontal motion, wall bounces, and a jump on each
+tick the ghost's replay recorded one. All jumps are merged into one list
+sorted by tick up front, so a tick looks up its jumps with a pointer
+instead of scanning every ghost. A ghost disappears on the tick its run
+ended.
+
+Ghosts only replay the chicken's movement. Their spike walls are not
+simulated, because each run had its own. Positions are kept in each
+run's own board coordinates; ``positions`` scales them to the current one.
+"""
+
+import numpy as np
+
+from .character import Chicken
+from .core import PHYSICS_DT
+
+
+class GhostPack:
+    """Many recorded runs stepped in lockstep with the live game"""
+
+    def __init__(self, replays, dt=PHYSICS_DT):
+        self.n = len(replays)
+        self.dt = dt
+        template = Chicken(0, 0)
+        self.gravity = template.gravity
+        self.jump_force = template.jump_force
+        self.speed = template.velocity.x
+        self.radius = template.radius
+        self.width = np.array([r.width for r in replays], dtype=np.float64)
+        self.height = np.array([r.height for r in replays], dtype=np.float64)
+        self.end_tick = np.array([r.ticks for r in replays], dtype=np.int64)
+
+        # Every (tick, ghost) jump, ordered by tick
+        counts = [len(r.jumps) for r in replays]
+        ticks = np.concatenate(
+            [np.frombuffer(r.jumps, dtype=np.uint32) for r in replays]
+            or [np.zeros(0, dtype=np.uint32)]
+        ).astype(np.int64)
+        owners = np.repeat(np.arange(self.n), counts)
+        order = np.argsort(ticks, kind="stable")
+        self.jump_ticks = ticks[order]
+        self.jump_owners = owners[order]
+        self.reset()
+
+    def reset(self):
+        """Put every ghost back at the start of its run"""
+        self.tick = 0
+        self.next_jump = 0
+        self.x = self.width / 2
+        self.y = self.height / 2
+        self.vx = np.full(self.n, float(self.speed))
+        self.vy = np.zeros(self.n)
+        self.alive = self.end_tick > 0
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+
+    def step(self):
+        """Advance every live ghost by one tick"""
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        alive = self.alive
+
+        # Jumps recorded for this tick
+        start = self.next_jump
+        stop = np.searchsorted(self.jump_ticks, self.tick, side="right")
+        if stop > start:
+            self.vy[self.jump_owners[start:stop]] = self.jump_force
+            self.next_jump = stop
+
+        # Same order of operations as Chicken.update
+        dt = self.dt
+        r = self.radius
+        vy = self.vy
+        vy[alive] += self.gravity * dt
+        self.x[alive] += self.vx[alive] * dt
+        self.y[alive] += vy[alive] * dt
+        left = alive & (self.x <= r)
+        right = alive & ~left & (self.x >= self.width - r)
+        self.x[left] = r
+        self.vx[left] = self.speed
+        self.x[right] = self.width[right] - r
+        self.vx[right] = -self.speed
+        self.alive = alive & (self.y > r) & (self.y < self.height - r)
+
+        self.tick += 1
+        self.alive &= self.tick < self.end_tick
+
+    def step_to(self, tick):
+        """Step until the ghosts are at ``tick``"""
+        while self.tick < tick:
+            self.step()
+
+    def positions(self, width, height, alpha=1.0):
+        """Ghost centers on a ``width`` x ``height`` board, interpolated by ``alpha``"""
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return x * (width / self.width), y * (height / self.height)
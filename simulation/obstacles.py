@@ -0,0 +1,171 @@
+from array import array
+
+
+class Spike:
+    """Obstacle spike that can kill the chicken"""
+
+    __slots__ = ("x", "y", "width", "height", "pointing_right")
+
+    def __init__(self, x, y, width=50, height=25, pointing_right=True):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.pointing_right = pointing_right
+
+    def get_collision_rect(self):
+        """Get collision rectangle for spike"""
+        return (self.x, self.y, self.width, self.height)
+
+    def get_triangle_points(self):
+        """Get triangle points for proper triangle rendering"""
+        if self.pointing_right:
+            # Left wall spikes pointing right
+            return [
+                self.x,
+                self.y,  # Bottom left
+                self.x,
+                self.y + self.height,  # Top left
+                self.x + self.width,
+                self.y + self.height / 2,  # Right center
+            ]
+        else:
+            # Right wall spikes pointing left
+            return [
+                self.x + self.width,
+                self.y,  # Bottom right
+                self.x + self.width,
+                self.y + self.height,  # Top right
+                self.x,
+                self.y + self.height / 2,  # Left center
+            ]
+
+    def check_collision(self, chicken_rect):
+        """Check if chicken collides with this spike"""
+        cx, cy, cw, ch = chicken_rect
+        sx, sy, sw, sh = self.get_collision_rect()
+
+        return cx < sx + sw and cx + cw > sx and cy < sy + sh and cy + ch > sy
+
+
+class SpikeColumn:
+    """All spikes of one wall, stored in flat preallocated buffers.
+
+    ``occupied`` holds one flag per row of the grid. After ``update_geometry``
+    the present spikes' y offsets are in ``ys`` and their triangles in
+    ``vertices`` as (x, y, u, v) vertices ready for a Mesh. Buffers are sized
+    for a full wall once and refilled in place, so regenerating a wall does
+    not allocate. Iterating yields ``Spike`` views for older callers.
+    """
+
+    __slots__ = (
+        "x",
+        "width",
+        "height",
+        "row_height",
+        "pointing_right",
+        "occupied",
+        "ys",
+        "vertices",
+        "count",
+        "revision",
+    )
+
+    def __init__(self, x, num_rows, width=40, row_height=35, pointing_right=True):
+        self.x = x
+        self.width = width
+        self.height = row_height - 2  # Leave a small gap between rows
+        self.row_height = row_height
+        self.pointing_right = pointing_right
+        self.occupied = bytearray(num_rows)
+        self.ys = array("d", bytes(8 * num_rows))
+        self.vertices = array("f", bytes(4 * 12 * num_rows))
+        self.count = 0
+        self.revision = 0  # Bumped whenever the geometry changes
+
+    def update_geometry(self):
+        """Recompute y offsets and triangle vertices from ``occupied``"""
+        ys = self.ys
+        vertices = self.vertices
+        height = self.height
+        if self.pointing_right:
+            # Bottom left, top left, right center
+            base_x = self.x
+            tip_x = self.x + self.width
+        else:
+            # Bottom right, top right, left center
+            base_x = self.x + self.width
+            tip_x = self.x
+
+        count = 0
+        for row, present in enumerate(self.occupied):
+            if not present:
+                continue
+            y = row * self.row_height
+            ys[count] = y
+            k = count * 12
+            vertices[k] = base_x
+            vertices[k + 1] = y
+            vertices[k + 4] = base_x
+            vertices[k + 5] = y + height
+            vertices[k + 8] = tip_x
+            vertices[k + 9] = y + height / 2
+            count += 1
+        self.count = count
+        self.revision += 1
+
+    def resize(self, x, num_rows):
+        """Move the column and stretch its row pattern onto ``num_rows`` rows.
+
+        Each new row copies the old row nearest to the same relative height.
+        Call ``update_geometry`` afterwards.
+        """
+        old = self.occupied
+        old_rows = len(old)
+        self.x = x
+        if num_rows == old_rows:
+            return
+        if old_rows:
+            self.occupied = bytearray(
+                old[min(old_rows - 1, int((row + 0.5) * old_rows / num_rows))]
+                for row in range(num_rows)
+            )
+        else:
+            self.occupied = bytearray(num_rows)
+        # Buffers only grow, so shrinking and growing back reuses them. A
+        # Mesh may still read the old vertices through triangle_vertices(),
+        # and an array with an exported view cannot be resized, so growing
+        # allocates new ones; the Mesh picks them up with the next revision
+        if len(self.ys) < num_rows:
+            self.ys = array("d", bytes(8 * num_rows))
+            self.vertices = array("f", bytes(4 * 12 * num_rows))
+
+    def triangle_vertices(self):
+        """Zero-copy view of the (x, y, u, v) vertices of present spikes"""
+        return memoryview(self.vertices)[: self.count * 12]
+
+    def collides(self, row, chicken_rect):
+        """Check the chicken rect against the spike in ``row``, if any"""
+        if not self.occupied[row]:
+            return False
+        cx, cy, cw, ch = chicken_rect
+        sy = row * self.row_height
+        return (
+            cx < self.x + self.width
+            and cx + cw > self.x
+            and cy < sy + self.height
+            and cy + ch > sy
+        )
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield Spike(
+                self.x,
+                self.ys[i],
+                width=self.width,
+                height=self.height,
+                pointing_right=self.pointing_right,
+            )
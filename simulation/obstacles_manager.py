@@ -0,0 +1,121 @@
+from .collision import sweep_point
+from .pattern_pool import SpikeColumnPool
+
+class SpikeGenerator:
+    """Manages spike generation and placement on vertical walls"""
+
+    def __init__(self, screen_width, screen_height, seed=None, pool=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.spike_width = 40
+        self.wall_thickness = 40  # How far spikes extend from wall
+        self.spike_height = 35  # Spikes sit on a fixed row grid
+        self.num_rows = int(screen_height // self.spike_height)
+        # Columns come from a pool seeded per game, for reproducible runs
+        self.pool = pool or SpikeColumnPool(
+            screen_width,
+            screen_height,
+            wall_thickness=self.wall_thickness,
+            spike_height=self.spike_height,
+            depth=0,
+        )
+        self.pool.reseed(seed)
+        self.spikes = [None, None]
+        self.generate_initial_spikes()
+
+    def generate_initial_spikes(self):
+        """Generate initial set of spikes with safe passages"""
+        # Left wall spikes point right, right wall spikes point left
+        for wall in (0, 1):
+            self._replace_column(wall, 0)
+
+    def _replace_column(self, wall, difficulty_level):
+        """Swap in a ready column for a wall and recycle the old one"""
+        old = self.spikes[wall]
+        self.spikes[wall] = self.pool.take(wall, difficulty_level)
+        if old is not None:
+            self.pool.give_back(wall, old)
+
+    def resize(self, screen_width, screen_height):
+        """Refit both walls and the pool to a new board size"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.num_rows = int(screen_height // self.spike_height)
+        self.pool.resize(screen_width, screen_height)
+        with self.pool.lock:
+            for wall, column in enumerate(self.spikes):
+                self.pool.fit(wall, column)
+
+    def regenerate_spikes(self, coords, difficulty_level=1):
+        """Regenerate spikes with increased difficulty"""
+        x, _ = coords
+        # Generate new spike pattern on the wall the chicken is heading to
+        wall = 0 if x > self.screen_width / 2 else 1
+        self._replace_column(wall, difficulty_level)
+
+    def check_collisions(self, chicken):
+        """Check if chicken collides with any spikes.
+
+        Only the rows the chicken's rect overlaps are looked up, and only on
+        a wall the chicken is close enough to touch.
+        """
+        chicken_rect = chicken.get_rect()
+        cx, cy, cw, ch = chicken_rect
+        first = max(int(cy // self.spike_height), 0)
+        last = min(int((cy + ch) // self.spike_height), self.num_rows - 1)
+        if first > last:
+            return False
+
+        near_left = cx < self.wall_thickness
+        near_right = cx + cw > self.screen_width - self.wall_thickness
+        for column, near in zip(self.spikes, (near_left, near_right)):
+            if not near:
+                continue
+            for row in range(first, last + 1):
+                if column.collides(row, chicken_rect):
+                    return True
+        return False
+
+    def sweep_collisions(self, chicken, prev_x, prev_y):
+        """Find the first spike contact along the chicken's last move.
+
+        The move from (prev_x, prev_y) to the chicken's position is swept
+        against every spike it could reach, so a long step cannot pass
+        through a spike. Returns (fraction, x, y): the fraction of the move
+        at contact and the chicken center there, or None.
+        """
+        x, y = chicken.pos.x, chicken.pos.y
+        r = chicken.radius
+        below = chicken.size - r  # Rect extent past the center on the far side
+
+        # Rows and walls touched by the bounding box of the whole move
+        bottom = min(prev_y, y) - r
+        top = max(prev_y, y) + below
+        first = max(int(bottom // self.spike_height), 0)
+        last = min(int(top // self.spike_height), self.num_rows - 1)
+        left = min(prev_x, x) - r
+        right = max(prev_x, x) + below
+
+        best = None
+        for column in self.spikes:
+            if left >= column.x + column.width or right <= column.x:
+                continue
+            for row in range(first, last + 1):
+                if not column.occupied[row]:
+                    continue
+                sy = row * column.row_height
+                fraction = sweep_point(
+                    prev_x,
+                    prev_y,
+                    x,
+                    y,
+                    column.x - below,
+                    sy - below,
+                    column.x + column.width + r,
+                    sy + column.height + r,
+                )
+                if fraction is not None and (best is None or fraction < best):
+                    best = fraction
+        if best is None:
+            return None
+        return (best, prev_x + (x - prev_x) * best, prev_y + (y - prev_y) * best)
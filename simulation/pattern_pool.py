@@ -0,0 +1,191 @@
+"""
+Pool of ready-made spike columns.
+
+Building a wall (rolling every row and computing its triangles) is moved
+off the frame that detects the wall hit: the pool keeps a queue of finished
+``SpikeColumn``s per wall and difficulty level, topped up by a worker thread
+or by ``refill`` in idle time, and ``take`` is a pop from that queue.
+Columns handed back with ``give_back`` are recycled.
+
+Each (wall, level) queue is fed by its own RNG stream derived from the run
+seed, so the n-th column taken for a wall and level is the same no matter
+when or by whom it was built. An empty queue falls back to building the
+next column of the stream on the spot.
+
+Every column is checked against the chicken's reachable arcs (see
+``reachability``); one with no passable gap gets a passable window carved
+into it, chosen from the same stream.
+"""
+
+import random
+import threading
+from collections import deque
+
+from .obstacles import SpikeColumn
+from .reachability import reachability_for
+
+MAX_LEVEL = 6  # The gap probability stops dropping here
+
+
+def gap_probability(difficulty_level):
+    """Chance that a row is left free at a difficulty level (0 = initial walls)"""
+    return max(0.5, 0.8 - (difficulty_level * 0.05))
+
+
+class SpikeColumnPool:
+    """Queues of prebuilt spike columns per wall and difficulty level"""
+
+    def __init__(
+        self, screen_width, screen_height, wall_thickness=40, spike_height=35, depth=4
+    ):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.wall_thickness = wall_thickness
+        self.spike_height = spike_height
+        self.num_rows = int(screen_height // spike_height)
+        self.reachability = reachability_for(
+            screen_height, self.num_rows, spike_height, wall_thickness
+        )
+        self.carved = 0  # Columns that needed a gap carved to be passable
+        self.depth = depth  # Ready columns kept per wall and level
+        self.ready = [[deque() for _ in range(MAX_LEVEL + 1)] for _ in range(2)]
+        self.free = [deque(), deque()]
+        self.streams = None
+        self.misses = 0  # Takes that found their queue empty
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.worker = None
+        self.stopping = False
+
+    def reseed(self, seed):
+        """Drop ready columns and restart every stream from ``seed``"""
+        with self.lock:
+            for wall in (0, 1):
+                for queue in self.ready[wall]:
+                    self.free[wall].extend(queue)
+                    queue.clear()
+            self.streams = [
+                [
+                    random.Random(f"{seed}/{wall}/{level}")
+                    for level in range(MAX_LEVEL + 1)
+                ]
+                for wall in (0, 1)
+            ]
+        self.wake.set()
+
+    def resize(self, screen_width, screen_height):
+        """Switch to a new board size, refitting the columns already built"""
+        with self.lock:
+            self.screen_width = screen_width
+            self.screen_height = screen_height
+            self.num_rows = int(screen_height // self.spike_height)
+            self.reachability = reachability_for(
+                screen_height, self.num_rows, self.spike_height, self.wall_thickness
+            )
+            for wall in (0, 1):
+                for queue in self.ready[wall]:
+                    for column in queue:
+                        self.fit(wall, column)
+
+    def fit(self, wall, column):
+        """Move a column onto the current board and keep it passable"""
+        column.resize(self.wall_x(wall), self.num_rows)
+        if not self.reachability.is_passable(column.occupied):
+            # The stretched pattern lost its gap; carve from the wall's
+            # initial stream, which is not drawn from again during a run
+            self.reachability.carve(column.occupied, self.streams[wall][0].random())
+            self.carved += 1
+        column.update_geometry()
+
+    def wall_x(self, wall):
+        """Left edge of a wall's spikes"""
+        return 0 if wall == 0 else self.screen_width - self.wall_thickness
+
+    def _build(self, wall, level):
+        """Build the next column of a stream; caller holds the lock"""
+        free = self.free[wall]
+        if free:
+            column = free.pop()
+            if len(column.occupied) != self.num_rows:
+                column.resize(self.wall_x(wall), self.num_rows)
+            column.x = self.wall_x(wall)
+        else:
+            column = SpikeColumn(
+                self.wall_x(wall),
+                self.num_rows,
+                width=self.wall_thickness,
+                row_height=self.spike_height,
+                pointing_right=wall == 0,
+            )
+        gap = gap_probability(level)
+        rand = self.streams[wall][level].random
+        occupied = column.occupied
+        for i in range(self.num_rows):
+            # Create gaps for safe passage
+            occupied[i] = rand() > gap
+        if not self.reachability.is_passable(occupied):
+            self.reachability.carve(occupied, rand())
+            self.carved += 1
+        column.update_geometry()
+        return column
+
+    def take(self, wall, difficulty_level):
+        """Next column for a wall at a difficulty level"""
+        level = min(difficulty_level, MAX_LEVEL)
+        with self.lock:
+            queue = self.ready[wall][level]
+            if queue:
+                column = queue.popleft()
+            else:
+                self.misses += 1
+                column = self._build(wall, level)
+        self.wake.set()
+        return column
+
+    def give_back(self, wall, column):
+        """Return a column that is no longer displayed for reuse"""
+        self.free[wall].append(column)
+
+    def refill(self, limit=None):
+        """Build columns into the emptiest queues; returns how many were built"""
+        built = 0
+        while limit is None or built < limit:
+            with self.lock:
+                if self.streams is None:
+                    return built
+                wall, level = min(
+                    ((w, l) for w in (0, 1) for l in range(MAX_LEVEL + 1)),
+                    key=lambda key: len(self.ready[key[0]][key[1]]),
+                )
+                if len(self.ready[wall][level]) >= self.depth:
+                    return built
+                self.ready[wall][level].append(self._build(wall, level))
+            built += 1
+        return built
+
+    def start_worker(self):
+        """Keep the queues topped up from a background thread"""
+        if self.worker:
+            return
+        self.stopping = False
+        self.worker = threading.Thread(
+            target=self._work, name="spike-column-pool", daemon=True
+        )
+        self.worker.start()
+
+    def stop_worker(self):
+        """Stop the background thread"""
+        if not self.worker:
+            return
+        self.stopping = True
+        self.wake.set()
+        self.worker.join()
+        self.worker = None
+
+    def _work(self):
+        while not self.stopping:
+            self.wake.wait()
+            self.wake.clear()
+            # One column per lock hold so takes never wait long
+            while not self.stopping and self.refill(limit=1):
+                pass
@@ -0,0 +1,185 @@
+"""
+Passability of spike walls.
+
+While the chicken is within reach of a wall it is committed for
+``2 * wall_thickness / speed`` seconds (in to the wall and back out), and
+during that window its center has to stay inside a band of free rows. A
+free run of rows is passable if some arc the chicken can actually be on
+when it enters the window stays inside the run's band the whole time.
+
+Arcs are indexed by the vertical velocity at window entry. For each entry
+velocity an arc table holds the lowest and highest displacement during the
+window and the height the last jump must have started from. Folding those
+into the row grid gives, for each start row, the fewest free rows that make
+a passable window. A column is then checked with a few bitmask tests, well
+under a millisecond, and ``bulk_fairness`` checks millions of columns with
+NumPy.
+
+Only arcs with no jump inside the window are considered. A jump there only
+adds upward motion, so the check can reject a column a perfect player could
+pass, but it never accepts an unfair one.
+"""
+
+from functools import lru_cache
+
+from .character import Chicken
+
+VELOCITY_STEP = 4.0  # px/s between arc table entries
+
+
+def arc_table(gravity, jump_force, window, fastest_fall):
+    """(velocity, lowest, highest, rise) per entry velocity.
+
+    ``lowest``/``highest`` are the center's displacement extremes during the
+    window; ``rise`` is how far above the last jump the chicken is when it
+    has that velocity.
+    """
+    table = []
+    v = -fastest_fall
+    end_t = window
+    while v <= jump_force:
+        end = v * end_t + 0.5 * gravity * end_t * end_t
+        lowest = min(0.0, end)
+        highest = max(0.0, end)
+        apex_t = -v / gravity
+        if 0 < apex_t < end_t:
+            highest = max(highest, v * apex_t + 0.5 * gravity * apex_t * apex_t)
+        rise = (jump_force * jump_force - v * v) / (-2 * gravity)
+        table.append((v, lowest, highest, rise))
+        v += VELOCITY_STEP
+    return table
+
+
+class Reachability:
+    """Minimal passable row windows for one board and set of physics constants.
+
+    Physics constants left as None are taken from the Chicken.
+    """
+
+    def __init__(
+        self,
+        screen_height,
+        num_rows,
+        row_height=35,
+        spike_height=33,
+        wall_thickness=40,
+        radius=None,
+        size=None,
+        gravity=None,
+        jump_force=None,
+        speed=None,
+    ):
+        template = Chicken(0, 0)
+        radius = template.radius if radius is None else radius
+        size = template.size if size is None else size
+        gravity = float(template.gravity if gravity is None else gravity)
+        jump_force = float(template.jump_force if jump_force is None else jump_force)
+        speed = float(abs(template.velocity.x) if speed is None else speed)
+        self.num_rows = num_rows
+        floor = radius
+        ceiling = screen_height - radius
+        apex = jump_force * jump_force / (-2 * gravity)
+        window = 2 * wall_thickness / speed
+        fastest_fall = (-2 * gravity * (ceiling - floor)) ** 0.5
+        # Flattest arcs first, so a band too narrow for any arc fails at once
+        arcs = sorted(
+            arc_table(gravity, jump_force, window, fastest_fall),
+            key=lambda arc: arc[2] - arc[1],
+        )
+
+        def passable(lo, hi):
+            # Some arc fits inside the open band (lo, hi) and can be reached:
+            # its last jump started above the floor and peaked below the ceiling
+            for _, lowest, highest, rise in arcs:
+                if highest - lowest >= hi - lo:
+                    return False
+                y_min = max(lo - lowest, floor + rise)
+                y_max = min(hi - highest, ceiling - apex + rise)
+                if y_min < y_max:
+                    return True
+            return False
+
+        below = size - radius
+        # (start row, free rows needed) of the smallest passable window per row
+        self.windows = []
+        for k in range(num_rows):
+            for m in range(1, num_rows - k + 1):
+                lo = floor if k == 0 else (k - 1) * row_height + spike_height + radius
+                hi = ceiling if k + m == num_rows else (k + m) * row_height - below
+                if passable(lo, hi):
+                    self.windows.append((k, m))
+                    break
+        # Occupancy is one byte per row, so a window's mask has 0x01 per row
+        # and a whole column is tested with one int.from_bytes
+        self.masks = [
+            sum(1 << (8 * row) for row in range(k, k + m)) for k, m in self.windows
+        ]
+
+    def is_passable(self, occupied):
+        """Check a column's row occupancy for at least one passable gap"""
+        bits = int.from_bytes(occupied, "little")
+        for mask in self.masks:
+            if not bits & mask:
+                return True
+        return False
+
+    def carve(self, occupied, choice):
+        """Clear the rows of one passable window, picked by ``choice`` in [0, 1)"""
+        if not self.windows:
+            return  # Board too short for any gap to be passable
+        k, m = self.windows[int(choice * len(self.windows))]
+        occupied[k : k + m] = bytes(m)
+
+    def passable_many(self, occupied):
+        """Bool per column of an (n, rows) occupancy array"""
+        import numpy as np
+
+        # Occupied rows in [0, i) per column; a window is free when the
+        # count does not change across it
+        filled = np.zeros((occupied.shape[0], self.num_rows + 1), dtype=np.int16)
+        np.cumsum(occupied, axis=1, out=filled[:, 1:])
+        ok = np.zeros(occupied.shape[0], dtype=bool)
+        for k, m in self.windows:
+            ok |= filled[:, k + m] == filled[:, k]
+        return ok
+
+    def carve_many(self, occupied, rng):
+        """Give every unpassable column of an (n, rows) array a random window"""
+        blocked = (~self.passable_many(occupied)).nonzero()[0]
+        if blocked.size and self.windows:
+            picks = rng.integers(len(self.windows), size=blocked.size)
+            for column, pick in zip(blocked, picks):
+                k, m = self.windows[pick]
+                occupied[column, k : k + m] = False
+        return blocked.size
+
+
+@lru_cache(maxsize=16)
+def reachability_for(screen_height, num_rows, row_height=35, wall_thickness=40):
+    """Cached Reachability for a board, with the chicken's default physics"""
+    return Reachability(
+        screen_height,
+        num_rows,
+        row_height=row_height,
+        spike_height=row_height - 2,
+        wall_thickness=wall_thickness,
+    )
+
+
+def bulk_fairness(reachability, gap_probability, count, seed=None, batch=100_000):
+    """Fraction of independently rolled columns with a passable gap.
+
+    Rolls ``count`` columns the way the generator does before any fairness
+    fix and checks them all with NumPy.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    passable = 0
+    done = 0
+    while done < count:
+        n = min(batch, count - done)
+        occupied = rng.random((n, reachability.num_rows)) > gap_probability
+        passable += int(reachability.passable_many(occupied).sum())
+        done += n
+    return passable / count if count else 1.0
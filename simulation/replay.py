@@ -0,0 +1,157 @@
+"""
+Compact binary replays.
+
+A run is fully determined by its seed, board size and the ticks on which
+jumps were applied. A replay file is a fixed header followed by the jump
+ticks as LEB128 varint deltas, so a jump usually costs one or two bytes.
+``play`` re-simulates a replay headlessly and ``verify`` checks the score
+it reaches against the recorded one. Both step GameCore tick by tick, the
+same rules the run was recorded with.
+"""
+
+import struct
+from array import array
+
+from .core import PHYSICS_DT, GameCore
+
+MAGIC = b"CJR1"
+# magic, seed, width, height, tick rate, total ticks, final score
+HEADER = struct.Struct("<4sQddHII")
+TICK_RATE = round(1 / PHYSICS_DT)  # The only rate replays can be played at
+# Board sides a replay may claim, in px; anything else is not a real window
+MIN_BOARD = 100
+MAX_BOARD = 16384
+
+
+class ReplayError(ValueError):
+    """Raised when a replay file cannot be decoded"""
+
+
+class Replay:
+    """Everything needed to re-simulate one run"""
+
+    __slots__ = ("seed", "width", "height", "tick_rate", "ticks", "score", "jumps")
+
+    def __init__(self, seed, width, height, tick_rate, ticks, score, jumps):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.tick_rate = tick_rate
+        self.ticks = ticks
+        self.score = score
+        self.jumps = jumps
+
+    @classmethod
+    def from_core(cls, core):
+        """Capture the run currently held by a GameCore"""
+        return cls(
+            core.seed,
+            core.width,
+            core.height,
+            round(1 / core.dt),
+            core.ticks,
+            core.score_manager.current_score,
+            array("I", core.jump_ticks),
+        )
+
+    def to_bytes(self):
+        """Encode as header plus varint-delta jump ticks"""
+        out = bytearray(
+            HEADER.pack(
+                MAGIC,
+                self.seed,
+                self.width,
+                self.height,
+                self.tick_rate,
+                self.ticks,
+                self.score,
+            )
+        )
+        previous = 0
+        for tick in self.jumps:
+            delta = tick - previous
+            previous = tick
+            while delta >= 0x80:
+                out.append((delta & 0x7F) | 0x80)
+                delta >>= 7
+            out.append(delta)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decode a replay produced by ``to_bytes``"""
+        if len(data) < HEADER.size:
+            raise ReplayError("replay is truncated")
+        magic, seed, width, height, tick_rate, ticks, score = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError(f"not a replay file (magic {magic!r})")
+        for name, value in (("width", width), ("height", height)):
+            # Written so NaN fails it too
+            if not MIN_BOARD <= value <= MAX_BOARD:
+                raise ReplayError(
+                    f"replay {name} {value!r} is outside {MIN_BOARD}-{MAX_BOARD} px"
+                )
+        if tick_rate != TICK_RATE:
+            raise ReplayError(f"unknown tick rate {tick_rate} Hz")
+
+        jumps = array("I")
+        tick = 0
+        delta = 0
+        shift = 0
+        for byte in memoryview(data)[HEADER.size :]:
+            delta |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            if not delta and jumps:
+                raise ReplayError(f"replay repeats jump tick {tick}")
+            tick += delta
+            if tick >= ticks:
+                raise ReplayError(f"jump at tick {tick} is past the run's {ticks} ticks")
+            jumps.append(tick)
+            delta = 0
+            shift = 0
+        if shift:
+            raise ReplayError("replay ends inside a jump tick")
+        return cls(seed, width, height, tick_rate, ticks, score, jumps)
+
+    def save(self, path):
+        """Write the encoded replay to ``path``"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay file written by ``save``"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def play(replay, pool=None):
+    """Re-simulate a replay headlessly and return the finished GameCore.
+
+    ``pool`` is a SpikeColumnPool for the replay's board size to reuse.
+    """
+    if replay.tick_rate != TICK_RATE:
+        raise ReplayError(
+            f"replay was recorded at {replay.tick_rate} Hz, "
+            f"physics runs at {TICK_RATE} Hz"
+        )
+    core = GameCore(replay.width, replay.height, seed=replay.seed, pool=pool)
+    jumps = replay.jumps
+    next_jump = 0
+    step = core.step
+    while core.ticks < replay.ticks and not core.game_over:
+        if next_jump < len(jumps) and jumps[next_jump] == core.ticks:
+            next_jump += 1
+            step(True)
+        else:
+            step(False)
+    return core
+
+
+def verify(replay, pool=None):
+    """Re-simulate a replay; return (ok, simulated score)"""
+    core = play(replay, pool)
+    score = core.score_manager.current_score
+    return score == replay.score and core.ticks == replay.ticks, score
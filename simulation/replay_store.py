@@ -0,0 +1,108 @@
+"""
+Replay files on disk.
+
+Finished runs are encoded by the caller and handed to a background writer
+thread, so saving a replay is a queue put and the frame a run ends on does
+no file I/O. The directory keeps the newest ``keep`` runs plus every run
+that set a high score (saved as ``best-<seed>.cjr``); older runs are deleted
+as new ones arrive. The writer keeps the listing in memory, newest last, so
+``recent`` neither scans nor stats the directory.
+
+Each file is written to a temporary name and renamed into place, so a crash
+never leaves a torn replay behind.
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+
+SUFFIX = ".cjr"
+BEST_PREFIX = "best-"
+KEEP = 200
+
+
+class ReplayStore:
+    """Replays saved to ``directory`` with a retention limit"""
+
+    def __init__(self, directory, keep=KEEP):
+        self.directory = directory
+        self.keep = keep
+        os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()  # Guards ``runs``
+        self.runs = deque()  # (path, best), oldest first
+        self.pending = queue.SimpleQueue()
+        self.writer = threading.Thread(
+            target=self._write, name="replay-store", daemon=True
+        )
+        self.writer.start()
+
+    def save(self, replay, best=False):
+        """Queue ``replay`` for writing; ``best`` runs are never pruned"""
+        prefix = BEST_PREFIX if best else ""
+        name = f"{prefix}{replay.seed:016x}{SUFFIX}"
+        self.pending.put((name, replay.to_bytes(), best))
+
+    def recent(self, limit=None):
+        """Paths of up to ``limit`` saved runs, newest first"""
+        with self.lock:
+            paths = [path for path, _ in reversed(self.runs)]
+        return paths[:limit]
+
+    def close(self):
+        """Write out everything saved so far and stop the writer"""
+        if self.writer is None:
+            return
+        self.pending.put(None)
+        self.writer.join()
+        self.writer = None
+
+    def _scan(self):
+        """Runs already on disk, oldest first"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(SUFFIX):
+                best = entry.name.startswith(BEST_PREFIX)
+                entries.append((entry.stat().st_mtime, entry.path, best))
+        entries.sort()
+        return [(path, best) for _, path, best in entries]
+
+    def _write(self):
+        # The one directory scan runs here rather than at startup
+        runs = self._scan()
+        with self.lock:
+            self.runs.extendleft(reversed(runs))
+        self._prune()
+
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            name, data, best = item
+            path = os.path.join(self.directory, name)
+            temp = path + ".tmp"
+            try:
+                with open(temp, "wb") as f:
+                    f.write(data)
+                os.replace(temp, path)
+            except OSError:
+                continue  # A full or read-only disk costs the replay, not the game
+            with self.lock:
+                if (path, best) in self.runs:
+                    self.runs.remove((path, best))  # Same seed saved again
+                self.runs.append((path, best))
+            self._prune()
+
+    def _prune(self):
+        """Delete the oldest regular runs beyond ``keep``"""
+        with self.lock:
+            regular = [path for path, best in self.runs if not best]
+            doomed = regular[: max(0, len(regular) - self.keep)]
+            for path in doomed:
+                self.runs.remove((path, False))
+        for path in doomed:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,256 @@
+"""
+Persistent scores and leaderboard.
+
+Finished games are appended to a log of fixed-size binary records by a
+background writer thread, so recording a game is a queue put. Startup reads
+a small JSON snapshot, which holds the totals, the score histogram and the
+leaderboard, and then replays only the log records written after it. Load
+time therefore does not grow with the number of past games.
+
+Every ``compact_every`` games the writer folds the log into the snapshot:
+
+1. It appends the log's records to the ``history`` archive, which is never
+   read at startup.
+2. It writes the new snapshot to a temporary file, fsyncs it and renames it
+   over the old one.
+3. It starts a fresh log under the next generation number.
+
+A crash at any point leaves either the old snapshot with its log or the new
+one. The history archive is trimmed back to the size the snapshot records,
+so redoing a compaction never duplicates games. A torn record at the end of
+a log is dropped.
+"""
+
+import bisect
+import copy
+import json
+import os
+import queue
+import struct
+import threading
+import time
+
+# time, seed, score, ticks
+RECORD = struct.Struct("<dQII")
+SNAPSHOT = "snapshot.json"
+HISTORY = "history.bin"
+LEADERBOARD_SIZE = 10
+
+
+def _log_name(generation):
+    return f"scores.{generation}.log"
+
+
+def _fsync_dir(directory):
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Renames are durable without this outside POSIX
+    fd = os.open(directory, os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ScoreTally:
+    """Totals, score histogram and leaderboard over a set of games"""
+
+    def __init__(self, leaderboard_size=LEADERBOARD_SIZE):
+        self.leaderboard_size = leaderboard_size
+        self.games = 0
+        self.total_score = 0
+        self.high_score = 0
+        self.histogram = {}  # score -> games
+        self.leaderboard = []  # (-score, time, seed, ticks), best first
+
+    def add(self, when, seed, score, ticks):
+        self.games += 1
+        self.total_score += score
+        self.high_score = max(self.high_score, score)
+        self.histogram[score] = self.histogram.get(score, 0) + 1
+        board = self.leaderboard
+        entry = (-score, when, seed, ticks)
+        if len(board) < self.leaderboard_size or entry < board[-1]:
+            bisect.insort(board, entry)
+            del board[self.leaderboard_size :]
+
+    def to_json(self):
+        return {
+            "games": self.games,
+            "total_score": self.total_score,
+            "high_score": self.high_score,
+            "histogram": self.histogram,
+            "leaderboard": self.leaderboard,
+        }
+
+    def load_json(self, data):
+        self.games = data["games"]
+        self.total_score = data["total_score"]
+        self.high_score = data["high_score"]
+        self.histogram = {int(s): n for s, n in data["histogram"].items()}
+        self.leaderboard = [tuple(entry) for entry in data["leaderboard"]]
+        del self.leaderboard[self.leaderboard_size :]
+
+
+class ScoreStore:
+    """Scores persisted to ``directory``.
+
+    ``tally`` includes every recorded game and is what the game reads.
+    ``written`` belongs to the writer thread and covers only games already
+    in the log, so a snapshot never includes a game still in the queue.
+    """
+
+    def __init__(
+        self, directory, compact_every=1000, leaderboard_size=LEADERBOARD_SIZE
+    ):
+        self.directory = directory
+        self.compact_every = compact_every
+        os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()  # Guards ``tally``
+        self.tally = ScoreTally(leaderboard_size)
+        self.generation = 0
+        self.history_size = 0  # Bytes of the archive covered by the snapshot
+        self.log_records = 0  # Records in the current log
+        self.load()
+        self.written = copy.deepcopy(self.tally)
+
+        self.pending = queue.SimpleQueue()
+        self.writer = threading.Thread(
+            target=self._write, name="score-store", daemon=True
+        )
+        self.writer.start()
+
+    @property
+    def high_score(self):
+        return self.tally.high_score
+
+    def load(self):
+        """Read the snapshot, then replay the log written since"""
+        try:
+            with open(os.path.join(self.directory, SNAPSHOT)) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            snapshot = None
+        if snapshot:
+            self.tally.load_json(snapshot)
+            self.generation = snapshot["generation"]
+            self.history_size = snapshot["history_size"]
+
+        log_path = os.path.join(self.directory, _log_name(self.generation))
+        try:
+            with open(log_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        whole = len(data) - len(data) % RECORD.size
+        for record in RECORD.iter_unpack(memoryview(data)[:whole]):
+            self.tally.add(*record)
+            self.log_records += 1
+        if whole != len(data):
+            # Drop a record torn by a crash mid-write
+            with open(log_path, "r+b") as f:
+                f.truncate(whole)
+
+    def record(self, score, seed=0, ticks=0):
+        """Add a finished game; the write happens on the writer thread"""
+        record = (time.time(), seed, score, ticks)
+        with self.lock:
+            self.tally.add(*record)
+        self.pending.put(record)
+
+    def top(self, count=None):
+        """Best games as (score, time, seed, ticks), best first"""
+        with self.lock:
+            board = self.tally.leaderboard[:count]
+        return [(-score, when, seed, ticks) for score, when, seed, ticks in board]
+
+    def close(self):
+        """Write out everything recorded so far and stop the writer"""
+        if self.writer is None:
+            return
+        self.pending.put(None)
+        self.writer.join()
+        self.writer = None
+
+    def _open_log(self):
+        return open(os.path.join(self.directory, _log_name(self.generation)), "ab")
+
+    def _write(self):
+        log = self._open_log()
+        try:
+            stopping = False
+            while not stopping:
+                record = self.pending.get()
+                # Drain whatever else is queued into one write and fsync
+                batch = bytearray()
+                while record is not None:
+                    batch += RECORD.pack(*record)
+                    self.written.add(*record)
+                    self.log_records += 1
+                    try:
+                        record = self.pending.get_nowait()
+                    except queue.Empty:
+                        break
+                stopping = record is None
+                if batch:
+                    log.write(batch)
+                    log.flush()
+                    os.fsync(log.fileno())
+                if self.log_records >= self.compact_every:
+                    log.close()
+                    self.compact()
+                    log = self._open_log()
+        finally:
+            log.close()
+
+    def compact(self):
+        """Fold the current log into the history archive and a new snapshot.
+
+        Runs on the writer thread, or on the caller's once ``close`` has
+        stopped the writer.
+        """
+        directory = self.directory
+        old_log = os.path.join(directory, _log_name(self.generation))
+        try:
+            with open(old_log, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        data = data[: len(data) - len(data) % RECORD.size]
+
+        with open(os.path.join(directory, HISTORY), "ab") as history:
+            # Undo any records a compaction that crashed part way had added
+            history.truncate(self.history_size)
+            history.write(data)
+            history.flush()
+            os.fsync(history.fileno())
+        history_size = self.history_size + len(data)
+
+        snapshot = self.written.to_json()
+        snapshot["generation"] = self.generation + 1
+        snapshot["history_size"] = history_size
+        path = os.path.join(directory, SNAPSHOT)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+        _fsync_dir(directory)
+
+        self.generation += 1
+        self.history_size = history_size
+        self.log_records = 0
+        try:
+            os.remove(old_log)
+        except FileNotFoundError:
+            pass
+
+    def history(self):
+        """Every compacted game as (time, seed, score, ticks), oldest first"""
+        try:
+            with open(os.path.join(self.directory, HISTORY), "rb") as f:
+                data = f.read(self.history_size)
+        except FileNotFoundError:
+            return []
+        return list(RECORD.iter_unpack(data))
@@ -0,0 +1,15 @@
+class Vec2:
+    """Minimal mutable 2D vector used by the headless simulation"""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __repr__(self):
+        return f"Vec2({self.x}, {self.y})"
@@ -0,0 +1,222 @@
+"""
+Many ChickenEnvs stepped together across worker processes.
+
+Environments are split into contiguous shards, one per worker process.
+Observations, rewards, done flags and actions live in shared memory laid out
+as one row per environment, so a step only sends a one-word command down
+each worker's pipe and waits for a one-word reply; nothing per environment
+is pickled.
+
+Finished environments are reset inside the same step (autoreset): their
+``terminated``/``truncated`` flag is set, ``final_scores`` holds the score
+the episode ended with and the observation row already belongs to the next
+episode.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .env import ChickenEnv
+
+FIELDS = (
+    "observations",
+    "rewards",
+    "terminated",
+    "truncated",
+    "final_scores",
+    "actions",
+)
+
+
+class _Buffers:
+    """Named arrays over one shared memory block"""
+
+    def __init__(self, num_envs, observation_size, name=None):
+        layout = (
+            (np.float32, (num_envs, observation_size)),
+            (np.float32, (num_envs,)),
+            (np.bool_, (num_envs,)),
+            (np.bool_, (num_envs,)),
+            (np.int32, (num_envs,)),
+            (np.uint8, (num_envs,)),
+        )
+        sizes = [
+            np.dtype(dtype).itemsize * int(np.prod(shape)) for dtype, shape in layout
+        ]
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=sum(sizes))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        offset = 0
+        for field, (dtype, shape), size in zip(FIELDS, layout, sizes):
+            setattr(
+                self,
+                field,
+                np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset),
+            )
+            offset += size
+
+    def close(self):
+        # Views must go before the mapping can be closed
+        for field in FIELDS:
+            setattr(self, field, None)
+        self.shm.close()
+
+
+class _Shard:
+    """A contiguous run of environments stepping into the shared buffers"""
+
+    def __init__(self, buffers, start, stop, env_kwargs, seed):
+        self.buffers = buffers
+        self.start = start
+        self.envs = [
+            ChickenEnv(seed=None if seed is None else f"{seed}/{index}", **env_kwargs)
+            for index in range(start, stop)
+        ]
+
+    def reset(self):
+        buffers = self.buffers
+        for i, env in enumerate(self.envs, self.start):
+            env.reset()
+            env.observe(buffers.observations[i])
+            buffers.rewards[i] = 0.0
+            buffers.terminated[i] = False
+            buffers.truncated[i] = False
+
+    def step(self):
+        buffers = self.buffers
+        observations = buffers.observations
+        actions = buffers.actions
+        for i, env in enumerate(self.envs, self.start):
+            row = observations[i]
+            reward, terminated, truncated = env.step_into(actions[i], row)
+            buffers.rewards[i] = reward
+            buffers.terminated[i] = terminated
+            buffers.truncated[i] = truncated
+            if terminated or truncated:
+                buffers.final_scores[i] = env.core.score_manager.current_score
+                env.reset()
+                env.observe(row)
+
+
+def _worker(conn, name, num_envs, observation_size, start, stop, env_kwargs, seed):
+    buffers = _Buffers(num_envs, observation_size, name)
+    shard = _Shard(buffers, start, stop, env_kwargs, seed)
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                shard.step()
+            elif command == "reset":
+                shard.reset()
+            else:
+                break
+            conn.send(None)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        shard = None
+        buffers.close()
+        conn.close()
+
+
+class VectorEnv:
+    """``num_envs`` environments sharded over ``workers`` processes.
+
+    ``workers=0`` steps every environment in the calling process, which is
+    handy for debugging. ``step`` returns views into shared memory that are
+    overwritten by the next call; copy them to keep them.
+    """
+
+    def __init__(self, num_envs, workers=None, seed=None, **env_kwargs):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, num_envs)
+        self.num_envs = num_envs
+        probe = ChickenEnv(**env_kwargs)
+        self.observation_size = probe.observation_size
+        self.buffers = _Buffers(num_envs, self.observation_size)
+        self.shards = []  # In-process shards when workers == 0
+        self.conns = []
+        self.processes = []
+
+        if workers == 0:
+            self.shards.append(_Shard(self.buffers, 0, num_envs, env_kwargs, seed))
+            return
+        bounds = [num_envs * w // workers for w in range(workers + 1)]
+        context = multiprocessing.get_context()
+        for start, stop in zip(bounds, bounds[1:]):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(
+                    child,
+                    self.buffers.shm.name,
+                    num_envs,
+                    self.observation_size,
+                    start,
+                    stop,
+                    env_kwargs,
+                    seed,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.conns.append(parent)
+            self.processes.append(process)
+
+    def _broadcast(self, command):
+        for shard in self.shards:
+            getattr(shard, command)()
+        for conn in self.conns:
+            conn.send(command)
+        for conn in self.conns:
+            conn.recv()
+
+    def reset(self):
+        """Reset every environment; returns the observations"""
+        self._broadcast("reset")
+        return self.buffers.observations
+
+    def step(self, actions):
+        """Step every environment.
+
+        Returns (observations, rewards, terminated, truncated, final_scores).
+        """
+        self.buffers.actions[:] = actions
+        self._broadcast("step")
+        buffers = self.buffers
+        return (
+            buffers.observations,
+            buffers.rewards,
+            buffers.terminated,
+            buffers.truncated,
+            buffers.final_scores,
+        )
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        for conn in self.conns:
+            try:
+                conn.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join()
+        for conn in self.conns:
+            conn.close()
+        self.conns = []
+        self.processes = []
+        self.shards = []
+        self.buffers.close()
+        self.buffers.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
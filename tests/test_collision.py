@@ -0,0 +1,65 @@
+import random
+
+from simulation.character import Chicken
+from simulation.collision import sweep_point
+from simulation.obstacles_manager import SpikeGenerator
+
+WIDTH, HEIGHT = 400, 700
+
+
+def test_touching_an_edge_is_not_a_hit():
+    # Ending exactly on the left edge, and sliding along the top edge
+    assert sweep_point(-20, 5, 0, 5, 0, 0, 10, 10) is None
+    assert sweep_point(-20, 10, 30, 10, 0, 0, 10, 10) is None
+    # Standing still on a corner
+    assert sweep_point(10, 10, 10, 10, 0, 0, 10, 10) is None
+
+
+def test_start_inside_the_box_is_an_immediate_hit():
+    assert sweep_point(5, 5, 50, 50, 0, 0, 10, 10) == 0.0
+    assert sweep_point(5, 5, 5, 5, 0, 0, 10, 10) == 0.0
+
+
+def test_large_step_through_the_box_is_caught():
+    assert sweep_point(-100, 5, 100, 5, 0, 0, 10, 10) == 0.5
+    assert sweep_point(-100, 50, 100, 50, 0, 0, 10, 10) is None
+
+
+def test_large_step_through_a_spike_is_caught():
+    spikes = SpikeGenerator(WIDTH, HEIGHT, seed=3)
+    column = spikes.spikes[1]
+    row = column.occupied.index(1)
+    y = row * column.row_height + column.height / 2
+    chicken = Chicken(WIDTH + 100, y)
+
+    # The end of the step is already past the wall
+    assert not spikes.check_collisions(chicken)
+    fraction, x, hit_y = spikes.sweep_collisions(chicken, WIDTH / 2, y)
+    assert 0 < fraction < 1
+    # Contact is where the rect's far side reaches the column
+    assert x == column.x - (chicken.size - chicken.radius)
+    assert hit_y == y
+
+
+def test_standing_still_matches_the_overlap_tests():
+    rng = random.Random(0)
+    hits = 0
+    for seed in range(20):
+        spikes = SpikeGenerator(WIDTH, HEIGHT, seed=seed)
+        chicken = Chicken(0, 0)
+        for _ in range(500):
+            x = rng.uniform(-20, WIDTH + 20)
+            y = rng.uniform(-20, HEIGHT + 20)
+            chicken.pos.x, chicken.pos.y = x, y
+            rect = chicken.get_rect()
+            brute = any(
+                spike.check_collision(rect) for column in spikes.spikes for spike in column
+            )
+            swept = spikes.sweep_collisions(chicken, x, y)
+            assert spikes.check_collisions(chicken) == brute
+            assert (swept is not None) == brute
+            if swept is not None:
+                assert swept == (0.0, x, y)
+            hits += brute
+    # Enough positions land on spikes for the comparison to mean something
+    assert hits > 100
@@ -0,0 +1,34 @@
+import numpy as np
+
+from simulation.core import GameCore
+from simulation.ghosts import GhostPack
+from simulation.replay import Replay
+from test_replay import bot_run
+
+SEEDS = range(4)
+
+
+def test_ghosts_follow_the_replayed_runs_exactly():
+    replays = [Replay.from_core(bot_run(seed)) for seed in SEEDS]
+    pack = GhostPack(replays)
+    cores = [GameCore(r.width, r.height, seed=r.seed) for r in replays]
+    next_jumps = [0] * len(replays)
+
+    while pack.alive.any():
+        live = np.flatnonzero(pack.alive)
+        for i in live:
+            core, jumps = cores[i], replays[i].jumps
+            jump = next_jumps[i] < len(jumps) and jumps[next_jumps[i]] == core.ticks
+            next_jumps[i] += jump
+            core.step(jump)
+        pack.step()
+
+        for i in live:
+            chicken = cores[i].chicken
+            # Same operations in the same order, so not even rounding differs
+            assert pack.x[i] == chicken.pos.x
+            assert pack.y[i] == chicken.pos.y
+
+    for core, replay in zip(cores, replays):
+        assert core.ticks == replay.ticks
+        assert core.game_over
@@ -0,0 +1,36 @@
+from simulation.obstacles import SpikeColumn
+
+
+def test_growing_while_vertices_are_viewed():
+    column = SpikeColumn(0, 10)
+    column.occupied[:] = bytes([1, 0] * 5)
+    column.update_geometry()
+    # What the spike Mesh holds between regenerations
+    view = column.triangle_vertices()
+    drawn = view.tolist()
+
+    column.resize(0, 30)
+    column.update_geometry()
+
+    assert len(column.occupied) == 30
+    assert column.count == 15
+    assert len(column.triangle_vertices()) == 15 * 12
+    # The old buffer stays valid and unchanged until the Mesh is refilled
+    assert view.tolist() == drawn
+
+
+def test_shrinking_reuses_buffers():
+    column = SpikeColumn(0, 20)
+    vertices = column.vertices
+    column.resize(0, 10)
+    column.update_geometry()
+    column.resize(0, 20)
+    assert column.vertices is vertices
+
+
+def test_resize_stretches_rows():
+    column = SpikeColumn(0, 4)
+    column.occupied[:] = bytes([1, 0, 0, 1])
+    column.resize(40, 8)
+    assert column.x == 40
+    assert bytes(column.occupied) == bytes([1, 1, 0, 0, 0, 0, 1, 1])
@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+from simulation.pattern_pool import MAX_LEVEL, SpikeColumnPool
+from simulation.reachability import reachability_for
+
+BOARDS = [(700, 20), (480, 13), (1080, 30)]
+
+
+@pytest.mark.parametrize("height, rows", BOARDS)
+def test_passable_many_agrees_with_is_passable(height, rows):
+    reachability = reachability_for(height, rows)
+    rng = np.random.default_rng(rows)
+    # Each column rolled with its own gap probability, from walls to gaps
+    gap_probability = rng.random((5000, 1))
+    occupied = rng.random((5000, rows)) > gap_probability
+
+    many = reachability.passable_many(occupied)
+
+    single = [
+        reachability.is_passable(column.astype(np.uint8).tobytes())
+        for column in occupied
+    ]
+    assert many.tolist() == single
+    # Both answers turn up, or the comparison proves little
+    assert 0 < many.sum() < len(many)
+
+
+@pytest.mark.parametrize("height, rows", BOARDS)
+def test_carve_leaves_a_passable_column(height, rows):
+    reachability = reachability_for(height, rows)
+    rng = random.Random(rows)
+    choices = [0.0, 0.999_999] + [rng.random() for _ in range(500)]
+    for choice in choices:
+        occupied = bytearray(rng.random() < 0.9 for _ in range(rows))
+        reachability.carve(occupied, choice)
+        assert reachability.is_passable(occupied)
+
+    # A wall with no gap at all, for every window
+    for choice in np.arange(len(reachability.windows)) / len(reachability.windows):
+        occupied = bytearray([1] * rows)
+        reachability.carve(occupied, choice)
+        assert reachability.is_passable(occupied)
+
+
+@pytest.mark.parametrize("height, rows", BOARDS)
+def test_carve_many_leaves_every_column_passable(height, rows):
+    reachability = reachability_for(height, rows)
+    rng = np.random.default_rng(rows)
+    occupied = rng.random((2000, rows)) > 0.1
+
+    blocked = reachability.carve_many(occupied, rng)
+
+    assert blocked > 0
+    assert reachability.passable_many(occupied).all()
+
+
+@pytest.mark.parametrize("height", [480, 700, 1080])
+def test_pool_never_hands_out_an_impassable_column(height):
+    pool = SpikeColumnPool(400, height, depth=0)
+    pool.reseed(5)
+    for _ in range(500):
+        for wall in (0, 1):
+            column = pool.take(wall, MAX_LEVEL)
+            assert pool.reachability.is_passable(column.occupied)
+            pool.give_back(wall, column)
@@ -0,0 +1,157 @@
+import random
+
+import pytest
+
+from simulation.core import GameCore
+from simulation.pattern_pool import SpikeColumnPool
+from simulation.replay import HEADER, MAGIC, Replay, ReplayError, play, verify
+
+WIDTH, HEIGHT = 1000, 700
+MAX_TICKS = 20_000
+
+
+def bot_run(seed, pool=None):
+    """A headless run by a bot aiming for free rows, with seeded jitter"""
+    core = GameCore(WIDTH, HEIGHT, seed=seed, pool=pool)
+    rng = random.Random(seed)
+
+    def policy(core):
+        chicken = core.chicken
+        if chicken.gravity_velocity.y >= 0:
+            return False
+        column = core.spike_generator.spikes[1 if chicken.velocity.x > 0 else 0]
+        # Middle of the longest run of free rows on the wall ahead
+        best_start, best_length, start = 0, 0, None
+        for row, present in enumerate(bytes(column.occupied) + b"\x01"):
+            if not present and start is None:
+                start = row
+            elif present and start is not None:
+                if row - start > best_length:
+                    best_start, best_length = start, row - start
+                start = None
+        middle = (best_start + best_length / 2) * column.row_height
+        return chicken.pos.y < middle - 25 + rng.uniform(-10, 10)
+
+    core.run(policy, MAX_TICKS)
+    return core
+
+
+def test_round_trip_keeps_every_field():
+    jumps = [0, 1, 127, 128, 300, 16_511, 16_512, 2_000_000, 2**32 - 2]
+    replay = Replay(2**64 - 1, 1000.0, 700.0, 120, 2**32 - 1, 42, jumps)
+
+    decoded = Replay.from_bytes(replay.to_bytes())
+
+    assert decoded.seed == replay.seed
+    assert (decoded.width, decoded.height) == (1000.0, 700.0)
+    assert decoded.tick_rate == 120
+    assert (decoded.ticks, decoded.score) == (replay.ticks, 42)
+    assert list(decoded.jumps) == jumps
+
+
+def test_varint_deltas_are_compact():
+    # Deltas below 128 take one byte, below 16384 two
+    replay = Replay(1, WIDTH, HEIGHT, 120, 1000, 0, [5, 10, 200])
+    assert len(replay.to_bytes()) == HEADER.size + 1 + 1 + 2
+
+
+def test_no_jumps():
+    replay = Replay(7, WIDTH, HEIGHT, 120, 10, 0, [])
+    assert list(Replay.from_bytes(replay.to_bytes()).jumps) == []
+
+
+def test_truncated_header_is_rejected():
+    data = Replay(1, WIDTH, HEIGHT, 120, 10, 0, []).to_bytes()
+    with pytest.raises(ReplayError, match="truncated"):
+        Replay.from_bytes(data[: HEADER.size - 1])
+
+
+def test_bad_magic_is_rejected():
+    data = Replay(1, WIDTH, HEIGHT, 120, 10, 0, []).to_bytes()
+    with pytest.raises(ReplayError, match="not a replay"):
+        Replay.from_bytes(b"XXXX" + data[4:])
+
+
+def test_truncated_varint_is_rejected():
+    data = Replay(1, WIDTH, HEIGHT, 120, 1000, 0, [300]).to_bytes()
+    with pytest.raises(ReplayError, match="inside a jump tick"):
+        Replay.from_bytes(data[:-1])
+
+
+def test_repeated_jump_tick_is_rejected():
+    header = HEADER.pack(MAGIC, 1, WIDTH, HEIGHT, 120, 10, 0)
+    # A first jump on tick 0 is a zero delta too
+    assert list(Replay.from_bytes(header + bytes([0, 3])).jumps) == [0, 3]
+    # A zero delta after it would jump twice on one tick
+    with pytest.raises(ReplayError, match="repeats jump tick 3"):
+        Replay.from_bytes(header + bytes([3, 0]))
+
+
+@pytest.mark.parametrize("jumps", [[10], [2, 15]])
+def test_jump_past_the_run_is_rejected(jumps):
+    data = Replay(1, WIDTH, HEIGHT, 120, 10, 0, jumps).to_bytes()
+    with pytest.raises(ReplayError, match="past the run"):
+        Replay.from_bytes(data)
+
+
+@pytest.mark.parametrize(
+    "width, height",
+    [
+        (float("nan"), HEIGHT),
+        (WIDTH, float("inf")),
+        (-WIDTH, HEIGHT),
+        (WIDTH, 0.0),
+        (WIDTH, 1e12),
+    ],
+)
+def test_impossible_board_is_rejected(width, height):
+    data = HEADER.pack(MAGIC, 1, width, height, 120, 10, 0)
+    with pytest.raises(ReplayError, match="outside"):
+        Replay.from_bytes(data)
+
+
+def test_unknown_tick_rate_is_rejected():
+    data = HEADER.pack(MAGIC, 1, WIDTH, HEIGHT, 7, 10, 0)
+    with pytest.raises(ReplayError, match="tick rate"):
+        Replay.from_bytes(data)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_recorded_runs_verify(seed, tmp_path):
+    core = bot_run(seed)
+    path = tmp_path / "run.cjr"
+    Replay.from_core(core).save(path)
+
+    ok, score = verify(Replay.load(path))
+
+    assert ok
+    assert score == core.score_manager.current_score
+
+
+def test_tampered_score_fails_verification():
+    replay = Replay.from_core(bot_run(3))
+    replay.score += 1
+    ok, score = verify(replay)
+    assert not ok
+    assert score == replay.score - 1
+
+
+def test_wrong_tick_rate_is_rejected():
+    replay = Replay.from_core(bot_run(3))
+    replay.tick_rate = 60
+    with pytest.raises(ReplayError, match="60 Hz"):
+        play(replay)
+
+
+def test_pool_worker_does_not_change_seeded_runs():
+    pool = SpikeColumnPool(WIDTH, HEIGHT)
+    pool.start_worker()
+    try:
+        for seed in range(20):
+            threaded = bot_run(seed, pool=pool)
+            inline = bot_run(seed, pool=SpikeColumnPool(WIDTH, HEIGHT, depth=0))
+            assert Replay.from_core(threaded).to_bytes() == (
+                Replay.from_core(inline).to_bytes()
+            ), seed
+    finally:
+        pool.stop_worker()
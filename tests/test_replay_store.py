@@ -0,0 +1,49 @@
+import os
+
+from simulation.replay import Replay
+from simulation.replay_store import ReplayStore
+
+
+def run(seed, score=0):
+    return Replay(seed, 1000, 700, 120, 100, score, [10, 50])
+
+
+def names(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_keeps_newest_runs_and_every_best(tmp_path):
+    store = ReplayStore(str(tmp_path), keep=3)
+    for seed in range(1, 9):
+        store.save(run(seed, score=seed), best=seed in (2, 5))
+    store.close()
+
+    assert names(tmp_path) == [
+        "0000000000000006.cjr",
+        "0000000000000007.cjr",
+        "0000000000000008.cjr",
+        "best-0000000000000002.cjr",
+        "best-0000000000000005.cjr",
+    ]
+    newest = [os.path.basename(path) for path in store.recent(4)]
+    assert newest == [
+        "0000000000000008.cjr",
+        "0000000000000007.cjr",
+        "0000000000000006.cjr",
+        "best-0000000000000005.cjr",
+    ]
+    assert Replay.load(store.recent(1)[0]).score == 8
+
+
+def test_existing_runs_are_listed_and_pruned(tmp_path):
+    for seed in range(1, 6):
+        path = tmp_path / f"{seed:016x}.cjr"
+        run(seed).save(path)
+        os.utime(path, (seed, seed))  # Oldest first by seed
+
+    store = ReplayStore(str(tmp_path), keep=2)
+    store.save(run(9))
+    store.close()
+
+    assert names(tmp_path) == ["0000000000000005.cjr", "0000000000000009.cjr"]
+    assert [os.path.basename(path) for path in store.recent()] == names(tmp_path)[::-1]
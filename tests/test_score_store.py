@@ -0,0 +1,114 @@
+import os
+
+from simulation.score_store import (
+    HISTORY,
+    RECORD,
+    ScoreStore,
+    _log_name,
+)
+
+SCORES = [3, 0, 12, 7, 7, 1, 25, 4, 9, 0, 18, 2]
+
+
+def record_all(store, scores):
+    for i, score in enumerate(scores):
+        store.record(score, seed=i, ticks=100 * score)
+
+
+def assert_tally(store, scores):
+    """The store holds exactly the games with ``scores``"""
+    tally = store.tally
+    histogram = {}
+    for score in scores:
+        histogram[score] = histogram.get(score, 0) + 1
+    assert tally.games == len(scores)
+    assert tally.total_score == sum(scores)
+    assert tally.high_score == max(scores, default=0)
+    assert tally.histogram == histogram
+    best = sorted(scores, reverse=True)[: tally.leaderboard_size]
+    assert [score for score, *_ in store.top()] == best
+
+
+def reopen(directory, **kwargs):
+    store = ScoreStore(str(directory), **kwargs)
+    store.close()
+    return store
+
+
+def log_path(directory, generation):
+    return os.path.join(directory, _log_name(generation))
+
+
+def test_reload_from_snapshot_and_log_tail(tmp_path):
+    store = ScoreStore(str(tmp_path), compact_every=5)
+    record_all(store, SCORES)
+    store.close()
+
+    # The writer batches, so how many games each compaction takes varies;
+    # together the archive and the current log hold every game once
+    assert store.generation >= 1
+    store = reopen(tmp_path, compact_every=5)
+    assert_tally(store, SCORES)
+    compacted = [record[2] for record in store.history()]
+    tail = os.path.getsize(log_path(tmp_path, store.generation)) // RECORD.size
+    assert compacted == SCORES[: len(compacted)]
+    assert len(compacted) + tail == len(SCORES)
+
+
+def test_torn_log_tail_is_dropped(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    record_all(store, SCORES[:5])
+    store.close()
+    # A crash part way through writing the sixth record
+    with open(log_path(tmp_path, 0), "ab") as f:
+        f.write(RECORD.pack(0.0, 99, 1000, 1)[:-5])
+
+    store = ScoreStore(str(tmp_path))
+    assert_tally(store, SCORES[:5])
+    assert os.path.getsize(log_path(tmp_path, 0)) == 5 * RECORD.size
+
+    # Records written after the recovery are whole and in place
+    record_all(store, SCORES[5:])
+    store.close()
+    assert_tally(reopen(tmp_path), SCORES)
+
+
+def test_redone_compaction_trims_extra_history(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    record_all(store, SCORES[:7])
+    store.close()
+    # A compaction appended the log to the archive, then crashed before
+    # the new snapshot was renamed into place
+    with open(log_path(tmp_path, 0), "rb") as f:
+        log = f.read()
+    with open(tmp_path / HISTORY, "ab") as f:
+        f.write(log)
+
+    store = reopen(tmp_path)
+    assert_tally(store, SCORES[:7])
+    assert store.history() == []
+
+    store.compact()
+    assert os.path.getsize(tmp_path / HISTORY) == 7 * RECORD.size
+    assert [record[2] for record in store.history()] == SCORES[:7]
+    store = reopen(tmp_path)
+    assert_tally(store, SCORES[:7])
+    assert len(store.history()) == 7
+
+
+def test_stale_log_after_snapshot_rename_is_ignored(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    record_all(store, SCORES[:5])
+    store.close()
+    with open(log_path(tmp_path, 0), "rb") as f:
+        log = f.read()
+    store.compact()
+    # The crash came after the rename but before the old log was removed
+    with open(log_path(tmp_path, 0), "wb") as f:
+        f.write(log)
+
+    store = ScoreStore(str(tmp_path))
+    assert_tally(store, SCORES[:5])
+    record_all(store, SCORES[5:])
+    store.close()
+    assert_tally(reopen(tmp_path), SCORES)
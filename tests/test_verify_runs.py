@@ -0,0 +1,40 @@
+import verify_runs
+from simulation.replay import HEADER, MAGIC, Replay
+
+
+def write_header(path, width, height):
+    path.write_bytes(HEADER.pack(MAGIC, 1, width, height, 120, 10, 0))
+    return str(path)
+
+
+def test_valid_run_verifies(tmp_path):
+    path = tmp_path / "run.cjr"
+    Replay(1, 1000, 700, 120, 0, 0, []).save(path)
+
+    row = verify_runs.verify_file(str(path))
+
+    assert row[1] == "ok"
+
+
+def test_bad_headers_are_error_rows(tmp_path):
+    for name, width, height in (
+        ("nan.cjr", 1000, float("nan")),
+        ("huge.cjr", 1000, 1e12),
+        ("negative.cjr", -1000, 700),
+    ):
+        row = verify_runs.verify_file(write_header(tmp_path / name, width, height))
+        assert row[:2] == (name, "error")
+
+
+def test_simulator_crash_is_an_error_row(tmp_path, monkeypatch):
+    def broken(replay, pool):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(verify_runs, "play", broken)
+    path = tmp_path / "run.cjr"
+    Replay(1, 1000, 700, 120, 0, 0, []).save(path)
+
+    row = verify_runs.verify_file(str(path))
+
+    assert row[1] == "error"
+    assert row[-1] == "RuntimeError: boom"
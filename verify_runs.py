@@ -0,0 +1,138 @@
+"""
+Replay verification
+Re-simulates every recorded run in a directory across a process pool and
+writes a table of verified scores.
+
+Usage: python verify_runs.py RUNS_DIR [-o results.csv] [-j JOBS]
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import sys
+import time
+
+from simulation.pattern_pool import SpikeColumnPool
+from simulation.replay import Replay, ReplayError, play
+
+COLUMNS = (
+    "file",
+    "status",
+    "seed",
+    "claimed_score",
+    "verified_score",
+    "claimed_ticks",
+    "verified_ticks",
+    "detail",
+)
+
+# Column pools per board size, kept for the life of a worker process
+_pools = {}
+
+
+def verify_file(path):
+    """Re-simulate one replay file; returns a results table row"""
+    name = os.path.basename(path)
+    try:
+        replay = Replay.load(path)
+        size = (replay.width, replay.height)
+        pool = _pools.get(size)
+        if pool is None:
+            pool = _pools[size] = SpikeColumnPool(*size, depth=0)
+        core = play(replay, pool)
+    except (OSError, ReplayError) as e:
+        return (name, "error", "", "", "", "", "", str(e))
+    except Exception as e:
+        # A file that breaks the simulator must not take down the batch
+        return (name, "error", "", "", "", "", "", f"{type(e).__name__}: {e}")
+
+    score = core.score_manager.current_score
+    detail = []
+    if score != replay.score:
+        detail.append(f"score {replay.score} claimed, {score} verified")
+    if core.ticks != replay.ticks:
+        detail.append(f"ended on tick {core.ticks}, not {replay.ticks}")
+    return (
+        name,
+        "mismatch" if detail else "ok",
+        f"{replay.seed:016x}",
+        replay.score,
+        score,
+        replay.ticks,
+        core.ticks,
+        "; ".join(detail),
+    )
+
+
+def find_runs(directory, suffix=".cjr"):
+    """Replay files directly inside ``directory``, sorted by name"""
+    return sorted(
+        entry.path
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(suffix)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("runs", help="directory of recorded runs (.cjr)")
+    parser.add_argument(
+        "-o", "--output", default="results.csv", help="results table (CSV)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report progress"
+    )
+    args = parser.parse_args(argv)
+
+    paths = find_runs(args.runs)
+    total = len(paths)
+    # Enough chunks per worker to balance long and short runs
+    chunksize = max(1, min(64, total // (args.jobs * 16)))
+    counts = {"ok": 0, "mismatch": 0, "error": 0}
+    start = time.perf_counter()
+    shown = 0.0
+    # Rewrite one status line on a terminal, log a line now and then otherwise
+    tty = sys.stderr.isatty()
+    interval = 0.2 if tty else 5.0
+    clear = "\r\x1b[K" if tty else ""
+
+    with open(args.output, "w", newline="") as f, multiprocessing.Pool(
+        args.jobs
+    ) as workers:
+        table = csv.writer(f)
+        table.writerow(COLUMNS)
+        for done, row in enumerate(
+            workers.imap_unordered(verify_file, paths, chunksize), 1
+        ):
+            table.writerow(row)
+            counts[row[1]] += 1
+            if args.quiet:
+                continue
+            if row[1] != "ok":
+                print(f"{clear}{row[0]}: {row[1]}: {row[7]}", file=sys.stderr)
+            now = time.perf_counter()
+            if now - shown > interval or done == total:
+                shown = now
+                rate = done / (now - start)
+                print(
+                    f"{clear}{done}/{total} runs, {counts['mismatch']} mismatched,"
+                    f" {counts['error']} unreadable, {rate:.0f} runs/s",
+                    end="" if tty else "\n",
+                    file=sys.stderr,
+                )
+
+    if tty and total and not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"{counts['ok']} ok, {counts['mismatch']} mismatched,"
+        f" {counts['error']} unreadable; results in {args.output}"
+    )
+    return 0 if counts["ok"] == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
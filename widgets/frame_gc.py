@@ -0,0 +1,125 @@
+"""
+Opt-in garbage collection control for the frame loop.
+
+CPython runs a collection whenever enough container objects have been
+allocated, which during play means on whatever frame crosses the threshold.
+``FrameGC`` turns automatic collection off once setup is done, moves
+everything alive at that point into the permanent generation with
+``gc.freeze`` so it is never scanned again, and collects at points where a
+pause is not felt instead: a wall hit, pausing and game over.
+
+It can also count the memory blocks each frame leaves allocated
+(``sys.getallocatedblocks``) and every collection that runs, so steady play
+can be checked to allocate close to nothing and never to collect mid-jump.
+"""
+
+import gc
+import sys
+import time
+from array import array
+
+# Young objects tolerated before a frame collects anyway, so a long stretch
+# without a safe point cannot grow without bound
+YOUNG_CEILING = 50_000
+
+
+class FrameGC:
+    """Collections moved to safe points, with an optional per-frame block counter"""
+
+    def __init__(self, manage=True, count_blocks=False, capacity=600):
+        self.manage = manage
+        self.count_blocks = count_blocks
+        self.started = False
+        self.capacity = capacity
+        self.block_deltas = array("q", bytes(8 * capacity))  # Ring of counted frames
+        self.frames = 0  # Frames counted, ring index is frames % capacity
+        self.frame_blocks = 0
+        self.in_frame = False
+        self.collected_in_frame = False
+        self.safe = False  # A safe point is collecting
+        self.collections = 0
+        self.unscheduled = 0  # Collections that ran mid-frame outside a safe point
+        self.longest_ns = 0
+        self.collect_start = 0
+
+    def start(self):
+        """Freeze what setup left alive and stop automatic collections"""
+        if self.started:
+            return
+        self.started = True
+        if self.count_blocks:
+            gc.callbacks.append(self.on_collect)
+        if self.manage:
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+
+    def stop(self):
+        """Give collection back to the interpreter"""
+        if not self.started:
+            return
+        self.started = False
+        if self.count_blocks:
+            gc.callbacks.remove(self.on_collect)
+        if self.manage:
+            gc.unfreeze()
+            gc.enable()
+
+    def safe_point(self, generation=2):
+        """Collect now; call where a short pause is not noticed"""
+        if not self.manage or not self.started:
+            return
+        self.safe = True
+        try:
+            gc.collect(generation)
+        finally:
+            self.safe = False
+
+    def begin_frame(self):
+        """Mark the start of a frame"""
+        if not self.started:
+            return
+        self.in_frame = True
+        self.collected_in_frame = False
+        if self.count_blocks:
+            self.frame_blocks = sys.getallocatedblocks()
+
+    def end_frame(self):
+        """Count the frame's blocks and apply the young generation ceiling"""
+        if not self.in_frame:
+            return
+        if self.count_blocks and not self.collected_in_frame:
+            # Frames that collected free blocks and would hide allocations
+            self.block_deltas[self.frames % self.capacity] = (
+                sys.getallocatedblocks() - self.frame_blocks
+            )
+            self.frames += 1
+        self.in_frame = False
+        if self.manage and gc.get_count()[0] > YOUNG_CEILING:
+            self.safe_point(0)
+
+    def on_collect(self, phase, info):
+        """gc callback timing every collection"""
+        if phase == "start":
+            self.collect_start = time.perf_counter_ns()
+            return
+        self.collections += 1
+        self.longest_ns = max(self.longest_ns, time.perf_counter_ns() - self.collect_start)
+        if self.in_frame:
+            self.collected_in_frame = True
+            if not self.safe:
+                self.unscheduled += 1
+
+    def summary(self):
+        """Blocks per counted frame and collection counts"""
+        count = min(self.frames, self.capacity)
+        deltas = sorted(self.block_deltas[:count])
+        return {
+            "frames": self.frames,
+            "blocks_mean": sum(deltas) / count if count else 0.0,
+            "blocks_p50": deltas[count // 2] if count else 0,
+            "blocks_max": deltas[-1] if count else 0,
+            "collections": self.collections,
+            "unscheduled_collections": self.unscheduled,
+            "longest_collection_ms": self.longest_ns / 1e6,
+        }
@@ -1,81 +1,156 @@
 from kivy.uix.widget import Widget
-from kivy.uix.floatlayout import FloatLayout
-
-from kivy.uix.label import Label
 from kivy.clock import Clock
 from kivy.graphics import (
+    ClearBuffers,
+    ClearColor,
     Color,
     Ellipse,
+    Fbo,
+    InstructionGroup,
+    Mesh,
     Rectangle,
     Triangle,
     Line
 )
 from kivy.core.window import Window
 import math
-from .score_manager import ScoreManager
-from .character import Chicken
-from .obstacles_manager import SpikeGenerator
+import os
+import time
+from simulation.core import GameCore
+from simulation.pattern_pool import SpikeColumnPool
+from simulation.score_manager import ScoreManager
+from simulation.replay_store import ReplayStore
+from simulation.score_store import ScoreStore
+
+# Labels, overlays, ghosts (NumPy), replays and the profiler are imported
+# where they are first used, keeping them off the path to the first frame
+
+BACKGROUND_FPS = 20  # Tick rate while the window is minimized or unfocused
+MAX_RACE_GHOSTS = 500  # Past runs raced against at once
+CHICKEN_THEME = {
+    "body": (1, 0.9, 0.2),  # Bright yellow
+    "beak": (1, 0.5, 0),  # Orange
+    "eye": (0, 0, 0),  # Black
+}
 
 class GameManager(Widget):
-    """Main game widget containing all game logic and rendering"""
-
-    def __init__(self, **kwargs):
+    """Main game widget rendering a headless GameCore"""
+
+    def __init__(
+        self,
+        render_fps=60,
+        replay_dir=None,
+        trace_dir=None,
+        score_dir=None,
+        measure_wakeups=False,
+        gc_budget=False,
+        count_blocks=False,
+        **kwargs
+    ):
         super().__init__(**kwargs)
+        self.render_fps = render_fps
+        self.trace_dir = trace_dir or os.getcwd()  # Where F4 writes frame traces
 
         # Initialize game components
-        self.chicken = None
-        self.spike_generator = None
+        self.core = None
+        self.pool = None  # Spike columns prebuilt by a worker thread
         self.score_manager = ScoreManager()
-        self.game_over = False
+        # Finished games are persisted here when a directory is given
+        self.score_store = ScoreStore(score_dir) if score_dir else None
+        if self.score_store:
+            self.score_manager.high_score = self.score_store.high_score
+        # Finished runs are saved here when a directory is given
+        self.replay_store = ReplayStore(replay_dir) if replay_dir else None
+        self.high_score_at_start = 0  # High score when the current run began
         self.paused = False
         self.current_score = 0
         self.best_score = 0
 
-        # Create score label with proper setup
-        self.score_label_widget = Label(
-            text="0",
-            font_size="48sp",
-            color=(1, 1, 1, 1),  # White text
-            pos=(self.width/2, self.height),
-            size=(160, 60),
-            halign='center',
-            valign='middle'
-        )
-        self.score_label_widget.text_size = self.score_label_widget.size
-        
-        # Add score label to widget
-        self.add_widget(self.score_label_widget)
-
+        # The score label and the overlays are built by build_ui right
+        # after the first frame; overlays are only in the tree while shown
+        self.score_label_widget = None
         self.pause_layout = None
         self.game_over_layout = None
 
-        # Bind to window size changes and input
+        # Persistent canvas layers, mutated in place every frame
+        self.render_stats = {"frames": 0}
+        self.build_layers()
+
+        # Frame profiler, toggled with F3; None keeps the loop uninstrumented
+        self.profiler = None
+        self.profile_hud = None
+
+        # Collections moved to safe points, started once the UI is built;
+        # count_blocks counts the memory blocks left allocated per frame
+        self.frame_gc = None
+        if gc_budget or count_blocks:
+            from .frame_gc import FrameGC
+
+            self.frame_gc = FrameGC(manage=gc_budget, count_blocks=count_blocks)
+
+        # Render loop, only scheduled while there is something to animate;
+        # physics runs at its own fixed rate inside the core
+        self.loop_event = None
+        self.loop_fps = 0
+        self.background = False  # Window minimized or unfocused
+        self.wakeups = {} if measure_wakeups else None
+        self.loop_state_name = "idle"
+        self.loop_state_since = time.perf_counter()
+        self.state_seconds = {}
+
+        # Bind to window size changes, input and visibility
+        self.resize_trigger = Clock.create_trigger(self.apply_resize)
         self.bind(size=self.on_size_change) #type: ignore
         Window.bind(on_key_down=self.on_key_down)
+        Window.bind(on_minimize=self.on_window_hidden, on_restore=self.on_window_shown)
+        Window.bind(focus=self.on_window_focus)
 
-        # Start game loop
-        Clock.schedule_interval(self.update, 1.0 / 60.0)
+        # The first resize starts the game once the widget has its size
+        self.resize_trigger()
 
-        # Initialize when widget is ready
-        Clock.schedule_once(self.initialize_game, 0)
+    @property
+    def game_over(self):
+        return self.core is not None and self.core.game_over
 
-    def initialize_game(self, _):
-        """Initialize game components"""
-        if self.size[0] > 0 and self.size[1] > 0:
-            self.reset_game()
+    def initialize_game(self, _=None):
+        """Start the first run once the widget has a size"""
+        if self.core or self.width <= 0 or self.height <= 0:
+            return
+        self.reset_game()
+        # Text is rendered after the first frame instead of before it
+        Window.bind(on_flip=self.on_first_flip)
+
+    def on_first_flip(self, *_):
+        """Build the text UI once the first game frame is on screen"""
+        if not self.render_stats["frames"]:
+            return
+        Window.unbind(on_flip=self.on_first_flip)
+        # Handlers run before the buffer swap, so build on the next tick
+        Clock.schedule_once(self.build_ui, 0)
 
     def on_size_change(self, _, size):
+        # A window drag fires many size events; apply only the last one,
+        # once, on the next frame
         if size[0] > 0 and size[1] > 0:
-            # Update score label position
-            self.score_label_widget.center_x = size[0] / 2
-            self.score_label_widget.top = size[1] - 20
-            self.reset_game()
+            self.resize_trigger()
+
+    def apply_resize(self, _):
+        """Fit the layers and the running game to the current size"""
+        width, height = self.size
+        self.layout_layers()
+        self.layout_overlays()
+        if not self.core:
+            self.initialize_game()
+            return
+        # Keep the run going on the new board instead of restarting it
+        self.core.resize(width, height)
+        self.draw_game()
 
     def on_key_down(self, _, key, *__):
         """Handle keyboard input"""
         # Space bar (32) or Up arrow (273) to jump
-        if key in [32, 273] and self.chicken and not self.game_over and not self.paused:
-            self.chicken.jump()
+        if key in [32, 273] and self.core and not self.game_over and not self.paused:
+            self.core.jump()
         # R key to restart
         elif key == 114 and self.game_over:  # 'r' key
             self.reset_game()
@@ -83,6 +158,14 @@ class GameManager(Widget):
         elif key in [112, 27] and not self.game_over:  # 'p' key or Escape
             self.paused = not self.paused
             self.update_pause_menu()
+        # F3 toggles the frame profiler, F4 dumps its trace
+        elif key == 284:
+            self.toggle_profiler()
+        elif key == 285 and self.profiler:
+            self.dump_profile()
+        # G races the live run against past runs
+        elif key == 103:
+            self.toggle_race()
         return True
 
     def on_touch_down(self, touch):
@@ -92,8 +175,8 @@ class GameManager(Widget):
         elif self.paused:
             self.paused = False
             self.update_pause_menu()
-        elif self.chicken:
-            self.chicken.jump()
+        elif self.core:
+            self.core.jump()
         return True
 
     def reset_game(self):
@@ -101,297 +184,692 @@ class GameManager(Widget):
         # Remove any existing overlays
         self.clear_overlays()
         
-        # Initialize chicken at center
+        # Start a fresh run sized to the widget
         if self.width > 0 and self.height > 0:
-            center_x = self.width / 2
-            center_y = self.height / 2
-            self.chicken = Chicken(center_x, center_y)
-
-            # Initialize spike generator
-            self.spike_generator = SpikeGenerator(self.width, self.height)
-
-            # Reset game state
-            self.score_manager.reset_current_score()
-            self.game_over = False
+            self.core = GameCore(
+                self.width,
+                self.height,
+                score_manager=self.score_manager,
+                pool=self.spike_pool(),
+            )
+            self.high_score_at_start = self.score_manager.high_score
             self.paused = False
             self.update_score_display()
-            
-            # Update score label position
-            self.score_label_widget.center_x = self.width / 2
-            self.score_label_widget.top = self.height - 20
+            if self.profiler:
+                self.instrument()
+            if self.ghosts:
+                self.ghosts.reset()
+            self.refresh_loop()
+
+    def spike_pool(self):
+        """Column pool for the current size, refitted when the size changes"""
+        pool = self.pool
+        if not pool:
+            self.pool = pool = SpikeColumnPool(self.width, self.height)
+            pool.start_worker()
+        elif (pool.screen_width, pool.screen_height) != tuple(self.size):
+            pool.resize(self.width, self.height)
+        return pool
 
     def update_score_display(self):
         """Update the score display"""
+        if not self.score_label_widget:
+            return
         self.score_label_widget.text = str(self.score_manager.current_score)
+        # Keep the hidden game over text current so its texture is already
+        # rendered by the frame the chicken dies
+        self.game_over_score.text = (
+            f"Score: {self.score_manager.current_score}\n"
+            f"Best: {self.score_manager.high_score}"
+        )
 
     def clear_overlays(self):
         """Clear pause and game over overlays"""
-        if self.pause_layout:
+        if not self.pause_layout:
+            return
+        if self.pause_layout.parent:
             self.remove_widget(self.pause_layout)
-            self.pause_layout = None
-        if self.game_over_layout:
+        if self.game_over_layout.parent:
             self.remove_widget(self.game_over_layout)
-            self.game_over_layout = None
 
     def update_pause_menu(self):
         """Update pause menu visibility"""
+        self.refresh_loop()
         if self.paused:
             self.show_pause_menu()
-        else:
-            if self.pause_layout:
-                self.remove_widget(self.pause_layout)
-                self.pause_layout = None
+            if self.frame_gc:
+                self.frame_gc.safe_point()
+        elif self.pause_layout and self.pause_layout.parent:
+            self.remove_widget(self.pause_layout)
 
-    def update(self, dt):
-        """Main game update loop"""
+    def loop_state(self):
+        """Name of the state that decides how often the loop ticks"""
+        if not self.core:
+            return "idle"
         if self.game_over:
-            if not self.game_over_layout:
-                self.show_game_over()
+            return "game_over"
+        if self.paused:
+            return "paused"
+        if self.background:
+            return "background"
+        return "running"
+
+    def refresh_loop(self):
+        """Schedule, reschedule or stop the render loop for the current state"""
+        state = self.loop_state()
+        if state != self.loop_state_name:
+            now = time.perf_counter()
+            self.state_seconds[self.loop_state_name] = (
+                self.state_seconds.get(self.loop_state_name, 0.0)
+                + now - self.loop_state_since
+            )
+            self.loop_state_name = state
+            self.loop_state_since = now
+
+        fps = {"running": self.render_fps, "background": BACKGROUND_FPS}.get(state, 0)
+        if fps == self.loop_fps:
             return
-            
-        if self.paused or not self.chicken or not self.spike_generator:
+        if self.loop_event:
+            self.loop_event.cancel()
+            self.loop_event = None
+        self.loop_fps = fps
+        if self.profiler:
+            self.profiler.set_schedule(fps)
+        if fps:
+            self.loop_event = Clock.schedule_interval(self.update, 1.0 / fps)
+
+    def on_window_hidden(self, *_):
+        """Slow the loop down while minimized"""
+        self.background = True
+        self.refresh_loop()
+
+    def on_window_shown(self, *_):
+        """Resume the normal rate when restored with focus"""
+        self.background = not Window.focus
+        self.refresh_loop()
+
+    def on_window_focus(self, _, focused):
+        """Slow the loop down while another window has focus"""
+        self.background = not focused
+        self.refresh_loop()
+
+    def wakeup_report(self):
+        """Loop wakeups per second in each state seen so far"""
+        if self.wakeups is None:
+            return {}
+        seconds = dict(self.state_seconds)
+        seconds[self.loop_state_name] = (
+            seconds.get(self.loop_state_name, 0.0)
+            + time.perf_counter() - self.loop_state_since
+        )
+        return {
+            state: self.wakeups.get(state, 0) / elapsed
+            for state, elapsed in seconds.items()
+            if elapsed > 0
+        }
+
+    def update(self, dt):
+        """Main game update loop"""
+        if self.wakeups is not None:
+            state = self.loop_state_name
+            self.wakeups[state] = self.wakeups.get(state, 0) + 1
+
+        profiler = self.profiler
+        frame_gc = self.frame_gc
+        if not profiler and not frame_gc:
+            self.run_frame(dt)
             return
 
-        # Update chicken
-        (wall_hit, coords) = self.chicken.update(dt, (self.width, self.height))
+        if frame_gc:
+            frame_gc.begin_frame()
+        if profiler:
+            profiler.begin_frame()
+        self.run_frame(dt)
+        if profiler:
+            profiler.end_frame()
+            if profiler.frames % 30 == 0:
+                self.update_profile_hud()
+        if frame_gc:
+            frame_gc.end_frame()
+
+    def run_frame(self, dt):
+        """Advance the game and redraw for one frame"""
+        if self.paused or not self.core or self.game_over:
+            return
 
-        # Check if chicken hit a wall
-        if wall_hit:
-            self.score_manager.add_point()
+        # Advance the game rules by the fixed ticks this frame covers
+        if self.core.advance(dt):
             self.update_score_display()
-
-            # Generate new level on EVERY wall hit
-            self.spike_generator.regenerate_spikes(
-                coords, self.score_manager.difficulty_level
-            )
-
-        # Check spike collisions
-        if self.spike_generator.check_collisions(self.chicken):
-            self.chicken.alive = False
-
-        # Check if chicken died
-        if not self.chicken.alive:
-            self.game_over = True
+            # The chicken is turning around on the wall; collect the young
+            # generations now rather than mid-jump
+            if self.frame_gc:
+                self.frame_gc.safe_point(1)
+        if self.ghosts:
+            self.ghosts.step_to(self.core.ticks)
 
         # Redraw game elements (but not UI)
         self.draw_game()
 
-    def draw_game(self):
-        """Draw all game elements"""
-        if not self.canvas:
+        # The loop sleeps until the player restarts
+        if self.game_over:
+            self.save_replay()
+            self.record_score()
+            self.show_game_over()
+            self.refresh_loop()
+            if self.frame_gc:
+                self.frame_gc.safe_point()
+
+    def toggle_profiler(self):
+        """Turn frame profiling and its on-screen HUD on or off"""
+        if self.profiler:
+            self.profiler.uninstrument()
+            self.profiler = None
+            self.remove_widget(self.profile_hud)
             return
-        # Clear only the main canvas, not the entire widget
-        self.canvas.clear()
-        
-        with self.canvas:
-            # Background
-            Color(0.05, 0.05, 0.15)  # Dark blue background
-            Rectangle(pos=(0, 0), size=self.size)
 
-            # Draw decorative center orb
-            self.draw_center_orb()
+        from .profiler import FrameProfiler
 
-            # Draw vertical walls (visual reference)
-            self.draw_walls()
+        self.profiler = FrameProfiler(target_fps=self.loop_fps or self.render_fps)
+        self.instrument()
+        if not self.profile_hud:
+            from kivy.uix.label import Label
 
-            # Draw spikes
-            self.draw_spikes()
+            self.profile_hud = Label(
+                text="",
+                font_size="14sp",
+                color=(0.6, 1, 0.6, 1),
+                size=(420, 24),
+                halign='left',
+                valign='middle'
+            )
+            self.profile_hud.text_size = self.profile_hud.size
+        self.layout_profile_hud()
+        self.add_widget(self.profile_hud)
+
+    def layout_profile_hud(self):
+        """Keep the profiler HUD in the top left corner"""
+        if self.profile_hud:
+            self.profile_hud.pos = (10, self.height - 34)
+
+    def instrument(self):
+        """Wrap the per-frame phases of the widget and the current core"""
+        profiler = self.profiler
+        profiler.uninstrument()
+        profiler.instrument(self, "draw_game", "draw")
+        profiler.instrument(self, "show_game_over", "overlay")
+        profiler.instrument(self, "show_pause_menu", "overlay")
+        if self.core:
+            profiler.instrument(self.core.chicken, "update", "physics")
+            generator = self.core.spike_generator
+            profiler.instrument(generator, "sweep_collisions", "collision")
+            profiler.instrument(generator, "regenerate_spikes", "regeneration")
+
+    def update_profile_hud(self):
+        """Show the latest frame time percentiles"""
+        summary = self.profiler.summary()
+        self.profile_hud.text = (
+            f"frame p50 {summary['p50']:.2f} ms  p95 {summary['p95']:.2f} ms  "
+            f"p99 {summary['p99']:.2f} ms  dropped {summary['dropped']}"
+            f"/{summary['frames']}"
+        )
 
-            # Draw chicken
-            if self.chicken and self.chicken.alive:
-                self.draw_chicken()
-        
-        # Ensure score is on top by removing and re-adding it
-        if self.score_label_widget in self.children:
-            self.remove_widget(self.score_label_widget)
-        self.add_widget(self.score_label_widget)
+    def dump_profile(self):
+        """Write the profiler buffer as a Chrome trace file"""
+        os.makedirs(self.trace_dir, exist_ok=True)
+        path = os.path.join(
+            self.trace_dir, time.strftime("frame-trace-%Y%m%d-%H%M%S.json")
+        )
+        self.profiler.dump(path)
+
+    def build_layers(self):
+        """Create the persistent canvas layers, drawn beneath child widgets"""
+        # Background
+        self.background_layer = InstructionGroup()
+        self.background_rect = Rectangle(pos=(0, 0), size=self.size)
+        self.background_layer.add(Color(0.05, 0.05, 0.15))  # Dark blue background
+        self.background_layer.add(self.background_rect)
+
+        # Decorative center orb: main orb, inner glow and core
+        self.orb_layer = InstructionGroup()
+        self.orb_colors = []
+        self.orb_ellipses = []
+        for rgb in ((0.2, 0.3, 0.5), (0.3, 0.4, 0.7), (0.5, 0.6, 0.9)):
+            color = Color(*rgb, 1)
+            ellipse = Ellipse()
+            self.orb_layer.add(color)
+            self.orb_layer.add(ellipse)
+            self.orb_colors.append(color)
+            self.orb_ellipses.append(ellipse)
+
+        # Vertical walls (visual reference)
+        self.wall_layer = InstructionGroup()
+        self.left_wall = Rectangle(pos=(0, 0), size=(5, self.height))
+        self.right_wall = Rectangle(pos=(self.width - 5, 0), size=(5, self.height))
+        self.wall_layer.add(Color(0.15, 0.15, 0.25, 0.8))  # Slightly lighter than background
+        self.wall_layer.add(self.left_wall)
+        self.wall_layer.add(self.right_wall)
+
+        # Spikes: one fill mesh and one outline mesh per wall, refilled only
+        # when that wall is regenerated
+        self.spike_layer = InstructionGroup()
+        self.spike_meshes = [Mesh(mode="triangles") for _ in range(2)]
+        self.spike_outlines = [Mesh(mode="lines") for _ in range(2)]
+        self.drawn_columns = [None, None]
+        self.drawn_revisions = [0, 0]
+        self.spike_layer.add(Color(0.2, 0.2, 0.3))  # Dark gray-blue spikes
+        for mesh in self.spike_meshes:
+            self.spike_layer.add(mesh)
+        self.spike_layer.add(Color(0.15, 0.15, 0.2))  # Slightly darker outline
+        for mesh in self.spike_outlines:
+            self.spike_layer.add(mesh)
+
+        # Chicken: one textured quad from a sprite rendered per facing
+        self.chicken_layer = InstructionGroup()
+        self.chicken_sprite = Rectangle()
+        self.chicken_layer.add(Color(1, 1, 1))
+        self.chicken_layer.add(self.chicken_sprite)
+        self.chicken_visible = False
+        self.chicken_theme = dict(CHICKEN_THEME)
+        self.chicken_fbo = None
+        self.chicken_sprite_size = None  # Chicken size the sprites were drawn at
+        self.chicken_direction = 0
+
+        # Ghosts of past runs, all in one mesh under the live chicken; the
+        # layer is created by the first race
+        self.ghost_layer = None
+        self.ghosts = None
+
+        for layer in (
+            self.background_layer,
+            self.orb_layer,
+            self.wall_layer,
+            self.spike_layer,
+        ):
+            self.canvas.before.add(layer)  # type: ignore
+
+    def layout_layers(self):
+        """Fit the static layers to the current widget size"""
+        self.background_rect.size = self.size
+        self.left_wall.size = (5, self.height)
+        self.right_wall.pos = (self.width - 5, 0)
+        self.right_wall.size = (5, self.height)
+
+    def save_replay(self):
+        """Queue the finished run for the replay store"""
+        if not self.replay_store or self.core.resized:
+            return  # A resized run cannot be re-simulated
+        from simulation.replay import Replay
+
+        self.replay_store.save(
+            Replay.from_core(self.core),
+            best=self.score_manager.current_score > self.high_score_at_start,
+        )
+
+    def record_score(self):
+        """Queue the finished run for the score store"""
+        if self.score_store:
+            core = self.core
+            self.score_store.record(
+                self.score_manager.current_score, core.seed, core.ticks
+            )
 
-    def draw_walls(self):
-        """Draw vertical walls as visual reference"""
-        Color(0.15, 0.15, 0.25, 0.8)  # Slightly lighter than background
+    def shutdown(self):
+        """Flush the score and replay stores and stop background threads"""
+        if self.frame_gc:
+            self.frame_gc.stop()
+        if self.score_store:
+            self.score_store.close()
+        if self.replay_store:
+            self.replay_store.close()
+        if self.pool:
+            self.pool.stop_worker()
 
-        # Left wall
-        Rectangle(pos=(0, 0), size=(5, self.height))
+    def draw_game(self):
+        """Update the persistent layers for the current game state"""
+        if not self.core:
+            return
 
-        # Right wall
-        Rectangle(pos=(self.width - 5, 0), size=(5, self.height))
+        self.draw_center_orb()
+        self.draw_spikes()
+        self.draw_chicken()
+        self.draw_ghosts()
+        self.render_stats["frames"] += 1
 
     def draw_chicken(self):
-        """Draw the chicken character"""
-        if not self.chicken:
+        """Move the chicken layer to the chicken, hiding it once dead"""
+        chicken = self.core.chicken
+        if chicken.alive != self.chicken_visible:
+            self.chicken_visible = chicken.alive
+            if chicken.alive:
+                self.canvas.before.add(self.chicken_layer)  # type: ignore
+            else:
+                self.canvas.before.remove(self.chicken_layer)  # type: ignore
+        if not chicken.alive:
             return
 
-        # Chicken body (yellow circle)
-        Color(1, 0.9, 0.2)  # Bright yellow
-        Ellipse(
-            pos=(
-                self.chicken.pos.x - self.chicken.radius,
-                self.chicken.pos.y - self.chicken.radius,
-            ),
-            size=(self.chicken.size, self.chicken.size),
-        )
+        if chicken.size != self.chicken_sprite_size:
+            self.render_chicken_sprites(chicken)
 
-        # Chicken beak (orange triangle)
-        Color(1, 0.5, 0)  # Orange
-        beak_size = 8
-        direction = 1 if self.chicken.velocity.x > 0 else -1
-        beak_x = self.chicken.pos.x + (self.chicken.radius * direction * 0.7)
-        beak_y = self.chicken.pos.y
-
-        # Draw beak as small triangle
-        if direction > 0:  # Facing right
-            points = [
-                beak_x,
-                beak_y - 3,
-                beak_x,
-                beak_y + 3,
-                beak_x + beak_size,
-                beak_y,
-            ]
-        else:  # Facing left
-            points = [
-                beak_x,
-                beak_y - 3,
-                beak_x,
-                beak_y + 3,
-                beak_x - beak_size,
-                beak_y,
-            ]
+        # Pick the atlas cell facing where the chicken is heading
+        direction = 1 if chicken.velocity.x > 0 else -1
+        if direction != self.chicken_direction:
+            self.chicken_direction = direction
+            u = 0.5 if direction > 0 else 0.0
+            self.chicken_sprite.tex_coords = (u, 0, u + 0.5, 0, u + 0.5, 1, u, 1)
 
-        Triangle(points=points)
+        x, y = self.core.render_position()
+        cx, cy = self.chicken_sprite_anchor
+        self.chicken_sprite.pos = (x - cx, y - cy)
 
-        # Eyes
-        Color(0, 0, 0)  # Black
-        eye_size = 3
-        eye_offset = 4
-        Ellipse(
-            pos=(self.chicken.pos.x - eye_offset, self.chicken.pos.y + 2),
-            size=(eye_size, eye_size),
+    def render_chicken_sprites(self, chicken):
+        """Draw the chicken facing left and right into a two-cell texture"""
+        r = chicken.radius
+        beak_size = 8
+        # Cell wide enough for the beak, which sticks out past the body
+        half_width = math.ceil(max(r, r * 0.7 + beak_size)) + 1
+        half_height = r + 1
+        cell = (2 * half_width, 2 * half_height)
+
+        fbo = Fbo(size=(2 * cell[0], cell[1]))
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            for i, direction in enumerate((-1, 1)):
+                x = i * cell[0] + half_width
+                y = half_height
+
+                # Chicken body
+                Color(*self.chicken_theme["body"])
+                Ellipse(pos=(x - r, y - r), size=(chicken.size, chicken.size))
+
+                # Chicken beak pointing where the chicken is heading
+                Color(*self.chicken_theme["beak"])
+                beak_x = x + (r * direction * 0.7)
+                Triangle(
+                    points=(
+                        beak_x,
+                        y - 3,
+                        beak_x,
+                        y + 3,
+                        beak_x + beak_size * direction,
+                        y,
+                    )
+                )
+
+                # Eyes
+                eye_offset = 4
+                Color(*self.chicken_theme["eye"])
+                Ellipse(pos=(x - eye_offset, y + 2), size=(3, 3))
+        fbo.draw()
+
+        self.chicken_fbo = fbo
+        self.chicken_sprite.texture = fbo.texture
+        if self.ghost_layer:
+            self.ghost_layer.mesh.texture = fbo.texture
+        self.chicken_sprite.size = cell
+        self.chicken_sprite_anchor = (half_width, half_height)
+        self.chicken_sprite_size = chicken.size
+        self.chicken_direction = 0  # Set the texture cell on the next draw
+
+    def draw_ghosts(self):
+        """Move the ghost quads to the ghosts' positions"""
+        if not self.ghosts or self.chicken_sprite_size is None:
+            return
+        self.ghost_layer.draw(
+            self.width,
+            self.height,
+            self.core.alpha,
+            self.chicken_sprite.size,
+            self.chicken_sprite_anchor,
         )
 
+    def toggle_race(self):
+        """Start or stop racing against the most recent saved runs"""
+        if self.ghosts:
+            self.start_race([])
+            return
+        replays = self.recent_replays(MAX_RACE_GHOSTS)
+        if replays:
+            self.start_race(replays)
+        # With nothing to race against, keep the live run going
+
+    def start_race(self, replays):
+        """Race the next run against ``replays``; an empty list stops racing"""
+        self.ghosts = None
+        if replays:
+            from simulation.ghosts import GhostPack
+
+            self.ghosts = GhostPack(replays)
+            if not self.ghost_layer:
+                from .ghost_layer import GhostLayer
+
+                # Between the spikes and the live chicken
+                self.ghost_layer = GhostLayer()
+                layers = self.canvas.before  # type: ignore
+                layers.insert(layers.indexof(self.spike_layer) + 1, self.ghost_layer)
+            if self.chicken_sprite_size is None and self.core:
+                self.render_chicken_sprites(self.core.chicken)
+        if self.ghost_layer:
+            self.ghost_layer.set_ghosts(
+                self.ghosts, self.chicken_fbo.texture if self.chicken_fbo else None
+            )
+        self.reset_game()
+
+    def recent_replays(self, limit):
+        """Up to ``limit`` of the newest readable saved replays"""
+        if not self.replay_store:
+            return []
+        from simulation.replay import Replay
+
+        replays = []
+        for path in self.replay_store.recent():
+            if len(replays) == limit:
+                break
+            try:
+                replays.append(Replay.load(path))
+            except (OSError, ValueError):
+                continue  # Skip unreadable or foreign files
+        return replays
+
+    def set_chicken_theme(self, **colors):
+        """Recolor the chicken (body, beak, eye); the sprites are redrawn once"""
+        self.chicken_theme.update(colors)
+        self.chicken_sprite_size = None
+        if self.core and self.chicken_visible:
+            self.draw_chicken()
+
     def draw_center_orb(self):
-        """Draw decorative center orb"""
-        # Pulsing effect
+        """Pulse the decorative center orb"""
         pulse = abs(math.sin(Clock.get_time() * 2)) * 0.3 + 0.7
 
-        # Main orb
-        Color(0.2, 0.3, 0.5, 0.4 * pulse)
         orb_size = 500 + (self.score_manager.current_score * 2)
-        orb_x = self.width / 2 - orb_size / 2
-        orb_y = self.height / 2 - orb_size / 2
-        Ellipse(pos=(orb_x, orb_y), size=(orb_size, orb_size))
-        
-        # Inner glow
-        Color(0.3, 0.4, 0.7, 0.6 * pulse)
-        inner_size = orb_size * 0.6
-        inner_x = self.width / 2 - inner_size / 2
-        inner_y = self.height / 2 - inner_size / 2
-        Ellipse(pos=(inner_x, inner_y), size=(inner_size, inner_size))
-
-        # Core
-        Color(0.5, 0.6, 0.9, 0.8 * pulse)
-        core_size = orb_size * 0.3
-        core_x = self.width / 2 - core_size / 2
-        core_y = self.height / 2 - core_size / 2
-        Ellipse(pos=(core_x, core_y), size=(core_size, core_size))
+        for color, ellipse, alpha, scale in zip(
+            self.orb_colors, self.orb_ellipses, (0.4, 0.6, 0.8), (1, 0.6, 0.3)
+        ):
+            size = orb_size * scale
+            color.a = alpha * pulse
+            ellipse.pos = (self.width / 2 - size / 2, self.height / 2 - size / 2)
+            ellipse.size = (size, size)
 
     def draw_spikes(self):
-        """Draw all spikes as proper triangles"""
-        if not self.spike_generator:
-            return
-        Color(0.2, 0.2, 0.3)  # Dark gray-blue spikes that match background
-
-        for spikes in self.spike_generator.spikes:
-            for spike in spikes:
-                points = spike.get_triangle_points()
-                Triangle(points=points)
+        """Refill the spike meshes of any wall that has been regenerated"""
+        columns = self.core.spike_generator.spikes
+        for i, column in enumerate(columns):
+            if (
+                column is self.drawn_columns[i]
+                and column.revision == self.drawn_revisions[i]
+            ):
+                continue
+            self.drawn_columns[i] = column
+            self.drawn_revisions[i] = column.revision
+
+            # Vertices come straight from the column; three edges per outline.
+            # Kivy rejects an empty buffer view, so empty walls get a list
+            vertices = column.triangle_vertices() if column.count else []
+            count = column.count * 3
+            self.spike_meshes[i].vertices = vertices
+            self.spike_meshes[i].indices = range(count)
+            self.spike_outlines[i].vertices = vertices
+            self.spike_outlines[i].indices = [
+                v for k in range(0, count, 3)
+                for v in (k, k + 1, k + 1, k + 2, k + 2, k)
+            ]
 
-                # Add a slightly darker outline for definition
-                Color(0.15, 0.15, 0.2)
-                Line(points=points + [points[0], points[1]], width=1.2)
-                Color(0.2, 0.2, 0.3)  # Reset to spike color
+    def allocation_report(self):
+        """Blocks allocated per frame and collections, when counting blocks"""
+        if not self.frame_gc or not self.frame_gc.count_blocks:
+            return {}
+        return self.frame_gc.summary()
 
-    def show_pause_menu(self):
-        """Show pause menu overlay"""
-        if self.pause_layout or not hasattr(self.pause_layout, 'canvas'):
+    def build_ui(self, _=None):
+        """Create the score label and the overlays, once"""
+        if self.score_label_widget:
             return
-            
-        self.pause_layout = FloatLayout(size=self.size)
+        from kivy.uix.label import Label
 
-        # Dark overlay
+        self.score_label_widget = Label(
+            text="0",
+            font_size="48sp",
+            color=(1, 1, 1, 1),  # White text
+            size=(160, 60),
+            halign='center',
+            valign='middle'
+        )
+        self.score_label_widget.text_size = self.score_label_widget.size
+        self.add_widget(self.score_label_widget)
+        self.build_overlays()
+        self.update_score_display()
+        # Setup is done; what it left alive is never collected again
+        if self.frame_gc:
+            self.frame_gc.start()
+
+    def build_overlays(self):
+        """Create the pause and game over overlays and render their text"""
+        from kivy.uix.floatlayout import FloatLayout
+        from kivy.uix.label import Label
+
+        self.pause_layout = FloatLayout()
         with self.pause_layout.canvas: #type: ignore
+            # Dark overlay
             Color(0, 0, 0, 0.7)
-            Rectangle(pos=(0, 0), size=self.size)
+            self.pause_shade = Rectangle()
 
             # Menu box
-            box_width, box_height = 400, 200
-            box_x = self.width / 2 - box_width / 2
-            box_y = self.height / 2 - box_height / 2
-
             Color(0.15, 0.2, 0.3, 0.95)
-            Rectangle(pos=(box_x, box_y), size=(box_width, box_height))
-
+            self.pause_box = Rectangle(size=(400, 200))
             Color(1, 1, 1, 1)
-            Line(rectangle=(box_x, box_y, box_width, box_height), width=2)
-
-        # Title
-        pause_title = Label(
-            text="PAUSA",
-            font_size='40sp',
-            color=(1, 1, 1, 1),
-            size_hint=(None, None),
-            size=(300, 50),
-            pos=(self.width / 2 - 150, self.height / 2 + 60)
-        )
-        self.pause_layout.add_widget(pause_title)
-
-        # Instructions
-        pause_instructions = Label(
-            text="Pulsa [P] o [ESC] para continuar",
-            font_size='20sp',
-            color=(0.8, 0.8, 0.9, 1),
-            size_hint=(None, None),
-            size=(300, 40),
-            pos=(self.width / 2 - 150, self.height / 2 + 10)
-        )
-        self.pause_layout.add_widget(pause_instructions)
-
-        pause_touch = Label(
-            text="Toca la pantalla para seguir o R para reiniciar",
-            font_size='18sp',
-            color=(0.7, 0.7, 0.9, 1),
-            size_hint=(None, None),
-            size=(400, 30),
-            pos=(self.width / 2 - 200, self.height / 2 - 30)
-        )
-        self.pause_layout.add_widget(pause_touch)
-
-        self.add_widget(self.pause_layout)
-
-    def show_game_over(self):
-        """Show game over overlay"""
-        if self.game_over_layout:
-            return
-            
-        self.game_over_layout = FloatLayout(size=self.size)
+            self.pause_frame = Line(width=2)
+
+        # Title, instructions and touch hint
+        self.pause_labels = [
+            Label(
+                text="PAUSA",
+                font_size='40sp',
+                color=(1, 1, 1, 1),
+                size_hint=(None, None),
+                size=(300, 50),
+            ),
+            Label(
+                text="Pulsa [P] o [ESC] para continuar",
+                font_size='20sp',
+                color=(0.8, 0.8, 0.9, 1),
+                size_hint=(None, None),
+                size=(300, 40),
+            ),
+            Label(
+                text="Toca la pantalla para seguir o R para reiniciar",
+                font_size='18sp',
+                color=(0.7, 0.7, 0.9, 1),
+                size_hint=(None, None),
+                size=(400, 30),
+            ),
+        ]
 
-        # Dark red overlay
+        self.game_over_layout = FloatLayout()
         with self.game_over_layout.canvas: # type: ignore
+            # Dark red overlay
             Color(0.9, 0.2, 0.2, 0.7)
-            Rectangle(pos=(0, 0), size=self.size)
+            self.game_over_shade = Rectangle()
 
-        # Game over text
-        game_over_label = Label(
-            text=f"GAME OVER\nScore: {self.score_manager.current_score}\nBest: {self.score_manager.high_score}\n\nTap to restart or press R",
+        # Only the score line changes between games
+        self.game_over_score = Label(
+            text="Score: 0\nBest: 0",
             font_size='24sp',
             halign='center',
             valign='middle',
             color=(1, 1, 1, 1),
             size_hint=(None, None),
-            size=(400, 200),
-            pos=(self.width / 2 - 200, self.height / 2 - 100)
+            size=(400, 70),
         )
-        game_over_label.text_size = (400, 200)
-        self.game_over_layout.add_widget(game_over_label)
+        self.game_over_labels = [
+            Label(
+                text="GAME OVER",
+                font_size='24sp',
+                halign='center',
+                valign='middle',
+                color=(1, 1, 1, 1),
+                size_hint=(None, None),
+                size=(400, 40),
+            ),
+            self.game_over_score,
+            Label(
+                text="Tap to restart or press R",
+                font_size='24sp',
+                halign='center',
+                valign='middle',
+                color=(1, 1, 1, 1),
+                size_hint=(None, None),
+                size=(400, 40),
+            ),
+        ]
+
+        for label in self.game_over_labels:
+            label.text_size = label.size
+        for layout, labels in (
+            (self.pause_layout, self.pause_labels),
+            (self.game_over_layout, self.game_over_labels),
+        ):
+            for label in labels:
+                # Render now rather than on the frame the overlay appears
+                label.texture_update()
+                layout.add_widget(label)
+        self.layout_overlays()
+
+    def layout_overlays(self):
+        """Fit the HUDs and the overlays to the current widget size"""
+        self.layout_profile_hud()
+        if not self.score_label_widget:
+            return
+        self.score_label_widget.center_x = self.width / 2
+        self.score_label_widget.top = self.height - 20
+
+        cx, cy = self.width / 2, self.height / 2
+        box_x, box_y = cx - 200, cy - 100
+
+        self.pause_layout.size = self.size
+        self.pause_shade.size = self.size
+        self.pause_box.pos = (box_x, box_y)
+        self.pause_frame.rectangle = (box_x, box_y, 400, 200)
+        title, instructions, touch = self.pause_labels
+        title.pos = (cx - 150, cy + 60)
+        instructions.pos = (cx - 150, cy + 10)
+        touch.pos = (cx - 200, cy - 30)
+
+        self.game_over_layout.size = self.size
+        self.game_over_shade.size = self.size
+        title, score, hint = self.game_over_labels
+        title.pos = (cx - 200, cy + 50)
+        score.pos = (cx - 200, cy - 25)
+        hint.pos = (cx - 200, cy - 90)
+
+    def show_pause_menu(self):
+        """Show pause menu overlay"""
+        self.build_ui()
+        if not self.pause_layout.parent:
+            self.add_widget(self.pause_layout)
 
-        self.add_widget(self.game_over_layout)
\ No newline at end of file
+    def show_game_over(self):
+        """Show game over overlay"""
+        self.build_ui()
+        if not self.game_over_layout.parent:
+            self.add_widget(self.game_over_layout)
@@ -0,0 +1,74 @@
+"""
+Ghost chickens drawn in a single Mesh.
+
+Every ghost is a textured quad in one vertex buffer held as a NumPy array,
+refilled in place each frame from the ghosts' positions. Finished ghosts
+collapse to a zero-area quad. The quads use the live chicken's sprite atlas
+with a translucent color. Drawing any number of ghosts is therefore two
+instructions, the Color and the Mesh.
+"""
+
+import numpy as np
+from kivy.graphics import Color, InstructionGroup, Mesh
+
+MAX_GHOSTS = 16383  # Mesh indices are 16-bit, four vertices per ghost
+
+
+class GhostLayer(InstructionGroup):
+    """Canvas layer drawing a GhostPack"""
+
+    def __init__(self, alpha=0.35, **kwargs):
+        super().__init__(**kwargs)
+        self.add(Color(1, 1, 1, alpha))
+        self.mesh = Mesh(mode="triangles")
+        self.add(self.mesh)
+        self.ghosts = None
+        self.vertices = None  # (ghosts, 4 corners, x y u v), float32
+
+    def set_ghosts(self, ghosts, texture):
+        """Show ``ghosts`` (a GhostPack, or None), drawn with ``texture``"""
+        self.ghosts = ghosts
+        if ghosts is None or ghosts.n == 0:
+            self.mesh.indices = []
+            self.mesh.vertices = []
+            return
+        if ghosts.n > MAX_GHOSTS:
+            raise ValueError(f"at most {MAX_GHOSTS} ghosts fit in one mesh")
+        n = ghosts.n
+        self.vertices = np.zeros((n, 4, 4), dtype=np.float32)
+        self.vertices[:, 2:, 3] = 1.0  # Top corners sample the top of the atlas
+        quad = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint16)
+        self.mesh.indices = (quad + 4 * np.arange(n, dtype=np.uint16)[:, None]).ravel()
+        self.mesh.texture = texture
+
+    def draw(self, width, height, alpha, sprite_size, anchor):
+        """Move every quad to its ghost for this frame"""
+        ghosts = self.ghosts
+        if ghosts is None or ghosts.n == 0:
+            return
+        x, y = ghosts.positions(width, height, alpha)
+        left = x - anchor[0]
+        bottom = y - anchor[1]
+        dead = ~ghosts.alive
+        left[dead] = -sprite_size[0]  # Zero-area quads just off the board
+        bottom[dead] = 0
+
+        v = self.vertices
+        right = left + np.where(dead, 0, sprite_size[0])
+        top = bottom + np.where(dead, 0, sprite_size[1])
+        v[:, 0, 0] = left
+        v[:, 0, 1] = bottom
+        v[:, 1, 0] = right
+        v[:, 1, 1] = bottom
+        v[:, 2, 0] = right
+        v[:, 2, 1] = top
+        v[:, 3, 0] = left
+        v[:, 3, 1] = top
+
+        # Right-facing ghosts use the right half of the atlas
+        u = np.where(ghosts.vx > 0, 0.5, 0.0)
+        v[:, 0, 2] = u
+        v[:, 1, 2] = u + 0.5
+        v[:, 2, 2] = u + 0.5
+        v[:, 3, 2] = u
+        self.mesh.vertices = v.reshape(-1)
@@ -0,0 +1,177 @@
+"""
+Opt-in frame profiler.
+
+Times each frame and the phases inside it (physics, collision, regeneration,
+draw, overlay) into fixed-size ring buffers, summarizes frame times as
+percentiles and exports the buffer as Chrome trace-event JSON, which opens
+in chrome://tracing or Perfetto.
+
+Phases are timed by wrapping methods on the instrumented objects, so nothing
+is installed and nothing is paid while the profiler is off.
+"""
+
+import json
+import time
+from array import array
+from functools import wraps
+
+PHASES = ("frame", "physics", "collision", "regeneration", "draw", "overlay")
+EVENTS_PER_FRAME = 32  # Sizes the event ring relative to the frame ring
+
+
+class FrameProfiler:
+    """Ring buffer of the last ``capacity`` frames and their phases"""
+
+    def __init__(self, capacity=600, target_fps=60):
+        self.capacity = capacity
+        self.frame_budget_ns = int(1e9 / target_fps)
+        self.schedule = 0  # Bumped whenever the loop is rescheduled
+        # Frames: start time and duration of the update work, and the loop
+        # schedule and frame budget they ran under
+        self.frame_start = array("q", bytes(8 * capacity))
+        self.frame_duration = array("q", bytes(8 * capacity))
+        self.frame_schedule = array("Q", bytes(8 * capacity))
+        self.frame_budget = array("q", bytes(8 * capacity))
+        self.frames = 0  # Total frames recorded, ring index is frames % capacity
+        # Phase events: phase id, start time and duration
+        event_capacity = capacity * EVENTS_PER_FRAME
+        self.event_capacity = event_capacity
+        self.event_phase = array("B", bytes(event_capacity))
+        self.event_start = array("q", bytes(8 * event_capacity))
+        self.event_duration = array("q", bytes(8 * event_capacity))
+        self.events = 0
+        self.current_start = 0
+        self.instrumented = []
+
+    def set_schedule(self, fps):
+        """Start a new loop schedule at ``fps``; 0 means the loop stopped.
+
+        Gaps are only compared between frames of the same schedule, so
+        resuming after a pause is not a dropped frame.
+        """
+        self.schedule += 1
+        if fps:
+            self.frame_budget_ns = int(1e9 / fps)
+
+    def begin_frame(self):
+        """Mark the start of a frame"""
+        self.current_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        """Store the frame that began at the last ``begin_frame``"""
+        i = self.frames % self.capacity
+        self.frame_start[i] = self.current_start
+        self.frame_duration[i] = time.perf_counter_ns() - self.current_start
+        self.frame_schedule[i] = self.schedule
+        self.frame_budget[i] = self.frame_budget_ns
+        self.frames += 1
+
+    def record(self, phase, start, duration):
+        """Store one phase event"""
+        i = self.events % self.event_capacity
+        self.event_phase[i] = phase
+        self.event_start[i] = start
+        self.event_duration[i] = duration
+        self.events += 1
+
+    def wrap(self, phase_name, fn):
+        """Return ``fn`` timed as ``phase_name``"""
+        phase = PHASES.index(phase_name)
+        clock = time.perf_counter_ns
+        record = self.record
+
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(phase, start, clock() - start)
+
+        return timed
+
+    def instrument(self, obj, method, phase_name):
+        """Time ``obj.method`` as ``phase_name`` until ``uninstrument``"""
+        setattr(obj, method, self.wrap(phase_name, getattr(obj, method)))
+        self.instrumented.append((obj, method))
+
+    def uninstrument(self):
+        """Remove every wrapper installed by ``instrument``"""
+        for obj, method in self.instrumented:
+            obj.__dict__.pop(method, None)
+        self.instrumented.clear()
+
+    def recent_frames(self):
+        """Indices of the buffered frames, oldest first"""
+        count = min(self.frames, self.capacity)
+        first = self.frames - count
+        return [i % self.capacity for i in range(first, self.frames)]
+
+    def summary(self):
+        """Frame time percentiles in ms and dropped frame count"""
+        frames = self.recent_frames()
+        if not frames:
+            return {"frames": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "dropped": 0}
+
+        durations = sorted(self.frame_duration[i] for i in frames)
+        last = len(durations) - 1
+
+        def percentile(p):
+            return durations[min(last, int(p * len(durations)))] / 1e6
+
+        # A frame was dropped when the gap to the previous frame of the same
+        # schedule exceeds 1.5 of that schedule's frame budgets
+        schedule = self.frame_schedule
+        dropped = sum(
+            1
+            for a, b in zip(frames, frames[1:])
+            if schedule[a] == schedule[b]
+            and self.frame_start[b] - self.frame_start[a]
+            > self.frame_budget[b] * 3 // 2
+        )
+        return {
+            "frames": len(frames),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "dropped": dropped,
+        }
+
+    def to_chrome_trace(self):
+        """Buffered frames and phases as Chrome trace-event JSON data"""
+        frames = self.recent_frames()
+        oldest = self.frame_start[frames[0]] if frames else 0
+        events = []
+        for i in frames:
+            events.append(
+                {
+                    "name": "frame",
+                    "ph": "X",
+                    "ts": self.frame_start[i] / 1000,
+                    "dur": self.frame_duration[i] / 1000,
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+
+        count = min(self.events, self.event_capacity)
+        for n in range(self.events - count, self.events):
+            i = n % self.event_capacity
+            if self.event_start[i] < oldest:
+                continue
+            events.append(
+                {
+                    "name": PHASES[self.event_phase[i]],
+                    "ph": "X",
+                    "ts": self.event_start[i] / 1000,
+                    "dur": self.event_duration[i] / 1000,
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        """Write the buffer as a Chrome trace file"""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)